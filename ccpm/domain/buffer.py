@@ -1,6 +1,19 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Any, Optional, Union
 
+import numpy as np
+
+from ccpm.utils.day_keys import day_labels, first_day_on_or_after
+
+# Buffer zones indexed by how many of the 33% / 67% consumption thresholds
+# have been reached
+_ZONES = ("green", "yellow", "red")
+
+
+def _zone_for(consumption_pct: float) -> str:
+    """Return the buffer zone colour for a consumption percentage."""
+    return _ZONES[(consumption_pct >= 33) + (consumption_pct >= 67)]
+
 
 class BufferError(Exception):
     """Exception raised for errors in the Buffer class."""
@@ -17,6 +30,25 @@ class Buffer:
     - Feeding Buffer: Protects the critical chain from delays in feeding chains
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "size",
+        "buffer_type",
+        "connected_to",
+        "strategy_name",
+        "original_size",
+        "remaining_size",
+        "consumption_history",
+        "start_date",
+        "end_date",
+        "new_start_date",
+        "new_end_date",
+        "status_date",
+        "status",
+        "notes",
+    )
+
     def __init__(
         self,
         id: str,
@@ -120,12 +152,7 @@ class Buffer:
 
         # Update status based on consumption percentage
         consumption_pct = self.get_consumption_percentage()
-        if consumption_pct >= 67:
-            self.status = "red"
-        elif consumption_pct >= 33:
-            self.status = "yellow"
-        else:
-            self.status = "green"
+        self.status = _zone_for(consumption_pct)
 
         # Record consumption
         self.consumption_history.append(
@@ -238,11 +265,7 @@ class Buffer:
         Returns:
             datetime: Effective start date or None
         """
-        return (
-            self.new_start_date
-            if hasattr(self, "new_start_date") and self.new_start_date
-            else self.start_date
-        )
+        return self.new_start_date or self.start_date
 
     def get_effective_end_date(self) -> Optional[datetime]:
         """
@@ -251,11 +274,7 @@ class Buffer:
         Returns:
             datetime: Effective end date or None
         """
-        return (
-            self.new_end_date
-            if hasattr(self, "new_end_date") and self.new_end_date
-            else self.end_date
-        )
+        return self.new_end_date or self.end_date
 
     def add_note(self, text: str, date: Optional[datetime] = None) -> Dict[str, Any]:
         """
@@ -344,7 +363,7 @@ class Buffer:
             if self.start_date:
                 dates.append(self.start_date)
 
-            if hasattr(self, "new_start_date") and self.new_start_date:
+            if self.new_start_date:
                 dates.append(self.new_start_date)
 
             start_date = min(dates) if dates else datetime.now()
@@ -363,66 +382,61 @@ class Buffer:
                 if valid_dates:
                     dates.append(max(valid_dates))
 
-            if hasattr(self, "end_date") and self.end_date:
+            if self.end_date:
                 dates.append(self.end_date)
 
-            if hasattr(self, "new_end_date") and self.new_end_date:
+            if self.new_end_date:
                 dates.append(self.new_end_date)
 
             end_date = max(dates) if dates else datetime.now()
             end_date = max(end_date, datetime.now())
 
-        # Generate list of all dates in the range
-        dates = []
-        current_date = start_date
-        while current_date <= end_date:
-            dates.append(current_date)
-            current_date += timedelta(days=1)
-
-        date_strs = [date.strftime("%Y-%m-%d") for date in dates]
+        date_strs = day_labels(start_date, end_date)
+        day_count = len(date_strs)
 
-        # Initialize data structures
-        remaining = [0] * len(dates)
-        consumed = [0] * len(dates)
-        status = [""] * len(dates)
+        # Sort events by date (stable, so same-date events keep their order)
+        # and drop those with no date
+        events = sorted(
+            (event for event in self.consumption_history if event["date"] is not None),
+            key=lambda x: x["date"],
+        )
 
-        # Create sorted consumption events with None date handling
-        if self.consumption_history:
-            # Filter out entries with None dates first, then sort
-            valid_events = [
-                event for event in self.consumption_history if event["date"] is not None
-            ]
-            events = (
-                sorted(valid_events, key=lambda x: x["date"]) if valid_events else []
-            )
-        else:
-            events = []
-
-        # For each date, calculate buffer state
-        current_remaining = self.original_size
-        current_consumed = 0
-        current_status = "green"
-
-        for i, date in enumerate(dates):
-            # Find all consumption events up to this date
-            while events and events[0]["date"] <= date:
-                event = events.pop(0)
-                if "new_remaining" in event:
-                    current_remaining = event["new_remaining"]
-                    current_consumed = self.original_size - current_remaining
-                if "status" in event:
-                    current_status = event["status"]
-
-            # Record state for this date
-            remaining[i] = current_remaining
-            consumed[i] = current_consumed
-            status[i] = current_status
+        # An event is first visible on the earliest diagram date on or after
+        # it; events before the range land on day 0, events after it are
+        # dropped
+        remaining_days = []
+        remaining_values = []
+        status_days = []
+        status_values = []
+        for event in events:
+            day = first_day_on_or_after(start_date, event["date"])
+            if day >= day_count:
+                break
+            if "new_remaining" in event:
+                remaining_days.append(day)
+                remaining_values.append(event["new_remaining"])
+            if "status" in event:
+                status_days.append(day)
+                status_values.append(event["status"])
+
+        # For each date, take the state from the last event visible on it
+        day_index = np.arange(day_count)
+        remaining = np.full(day_count, self.original_size, dtype=float)
+        last = np.searchsorted(remaining_days, day_index, side="right") - 1
+        seen = last >= 0
+        remaining[seen] = np.asarray(remaining_values, dtype=float)[last[seen]]
+        consumed = self.original_size - remaining
+
+        status = np.full(day_count, "green", dtype=object)
+        last = np.searchsorted(status_days, day_index, side="right") - 1
+        seen = last >= 0
+        status[seen] = np.asarray(status_values, dtype=object)[last[seen]]
 
         return {
             "dates": date_strs,
-            "remaining": remaining,
-            "consumed": consumed,
-            "status": status,
+            "remaining": remaining.tolist(),
+            "consumed": consumed.tolist(),
+            "status": status.tolist(),
             "original_size": self.original_size,
         }
 
@@ -456,12 +470,7 @@ class Buffer:
                 )
 
         # Determine status zones
-        if consumption_pct < 33:
-            zone = "green"
-        elif consumption_pct < 67:
-            zone = "yellow"
-        else:
-            zone = "red"
+        zone = _zone_for(consumption_pct)
 
         # Calculate performance ratio
         if consumption_pct == 0:
@@ -508,8 +517,9 @@ class Buffer:
             "new_end_date",
             "status_date",
         ]:
-            if hasattr(self, attr) and getattr(self, attr) is not None:
-                result[attr] = getattr(self, attr)
+            value = getattr(self, attr)
+            if value is not None:
+                result[attr] = value
 
         # Add consumption history (but trim for size)
         if self.consumption_history:
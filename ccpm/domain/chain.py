@@ -1,6 +1,32 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Any, Optional, Union
 
+import numpy as np
+
+from ccpm.utils.day_keys import day_labels, first_day_on_or_after
+
+# Task statuses counted in the cumulative flow diagram, in output order
+_CFD_STATUSES = ("planned", "in_progress", "completed", "on_hold", "cancelled")
+_CFD_STATUS_INDEX = {status: i for i, status in enumerate(_CFD_STATUSES)}
+
+
+def _latest_visible(first_days: List[int], day_count: int) -> np.ndarray:
+    """
+    For each diagram day, find the last entry already visible on that day.
+
+    Args:
+        first_days: First visible day of each entry, in entry order
+        day_count: Number of days in the diagram
+
+    Returns:
+        np.ndarray: Entry index per day, or -1 where no entry is visible yet
+    """
+    latest = np.full(day_count, -1)
+    for idx, day in enumerate(first_days):
+        if day < day_count:
+            latest[day] = idx
+    return np.maximum.accumulate(latest) if day_count else latest
+
 
 class ChainError(Exception):
     """Exception raised for errors in the Chain class."""
@@ -87,6 +113,30 @@ class Chain:
             self.tasks.append(task_id)
         return self
 
+    def extend_tasks(self, task_ids: List[str]) -> "Chain":
+        """
+        Add several tasks to this chain, in order.
+
+        Args:
+            task_ids: IDs of the tasks to add
+
+        Returns:
+            self: For method chaining
+
+        Raises:
+            ChainError: If any task ID is None or empty; no tasks are added
+        """
+        task_ids = list(task_ids)
+        if any(task_id is None or str(task_id).strip() == "" for task_id in task_ids):
+            raise ChainError("Task ID cannot be None or empty")
+
+        seen = set(self.tasks)
+        for task_id in task_ids:
+            if task_id not in seen:
+                seen.add(task_id)
+                self.tasks.append(task_id)
+        return self
+
     def remove_task(self, task_id: str) -> "Chain":
         """
         Remove a task from this chain.
@@ -218,51 +268,24 @@ class Chain:
 
                 total_duration += task_duration
 
-                # Debug print
-                print(f"Task {task_id}: duration={task_duration}")
-
                 # Calculate completed duration
                 task_completed = 0
                 if hasattr(task, "status"):
-                    print(f"  - has status: {task.status}")
                     if task.status == "completed":
                         # Task is complete
                         task_completed = task_duration
-                        print(f"  - completed: {task_completed}")
                     elif task.status == "in_progress":
                         # Task is in progress - use completion percentage
-                        print(f"  - in progress")
-                        if hasattr(task, "get_progress_percentage"):
-                            print(f"  - has get_progress_percentage method")
-                            # Check if it's callable
-                            if callable(getattr(task, "get_progress_percentage")):
-                                progress_pct = task.get_progress_percentage() / 100
-                                task_completed = task_duration * progress_pct
-                                print(
-                                    f"  - progress: {progress_pct*100}%, completed: {task_completed}"
-                                )
-                            else:
-                                print(f"  - get_progress_percentage is not callable")
-                        else:
-                            print(f"  - no get_progress_percentage method")
-
-                        if hasattr(task, "remaining_duration"):
-                            print(
-                                f"  - has remaining_duration: {task.remaining_duration}"
-                            )
-                            completed_work = task_duration - task.remaining_duration
-                            print(
-                                f"  - completed work based on remaining: {completed_work}"
-                            )
-                            if (
-                                task_completed == 0
-                            ):  # Only use if no progress percentage
-                                task_completed = completed_work
-                        else:
-                            print(f"  - no remaining_duration")
+                        if callable(getattr(task, "get_progress_percentage", None)):
+                            progress_pct = task.get_progress_percentage() / 100
+                            task_completed = task_duration * progress_pct
+
+                        # Fall back to the remaining duration if no progress
+                        # percentage is available
+                        if task_completed == 0 and hasattr(task, "remaining_duration"):
+                            task_completed = task_duration - task.remaining_duration
 
                 completed_duration += task_completed
-                print(f"  - added to completed_duration: {task_completed}")
 
         # Calculate completion percentage
         if total_duration > 0:
@@ -367,80 +390,78 @@ class Chain:
             end_date = max(end_dates) if end_dates else datetime.now()
             end_date = max(end_date, datetime.now())
 
-        # Generate list of all dates in the range
-        dates = []
-        current_date = start_date
-        while current_date <= end_date:
-            dates.append(current_date)
-            current_date += timedelta(days=1)
+        date_strs = day_labels(start_date, end_date)
+        day_count = len(date_strs)
 
-        date_strs = [date.strftime("%Y-%m-%d") for date in dates]
+        # Build each task's status for every day as a row of status indexes,
+        # then add the rows up into per-status counts
+        counts = np.zeros((len(_CFD_STATUSES), day_count), dtype=int)
+        for task_id in self.tasks:
+            if task_id not in tasks_dict:
+                continue
+
+            task = tasks_dict[task_id]
+
+            # Planned until started, then in progress (or on hold) until
+            # completed
+            codes = np.zeros(day_count, dtype=int)
+            actual_start_date = getattr(task, "actual_start_date", None)
+            if actual_start_date is not None:
+                started = first_day_on_or_after(start_date, actual_start_date)
+                if getattr(task, "status", None) == "on_hold":
+                    codes[started:] = _CFD_STATUS_INDEX["on_hold"]
+                else:
+                    codes[started:] = _CFD_STATUS_INDEX["in_progress"]
+
+                actual_end_date = getattr(task, "actual_end_date", None)
+                if actual_end_date is not None:
+                    ended = first_day_on_or_after(start_date, actual_end_date)
+                    codes[max(started, ended) :] = _CFD_STATUS_INDEX["completed"]
+
+            # For historical dates, the most recent status update before or
+            # on the date takes precedence
+            progress_history = getattr(task, "progress_history", None)
+            if progress_history:
+                entries = [
+                    entry
+                    for entry in progress_history
+                    if "status" in entry and entry["date"] is not None
+                ]
+                latest = _latest_visible(
+                    [
+                        first_day_on_or_after(start_date, entry["date"])
+                        for entry in entries
+                    ],
+                    day_count,
+                )
+                seen = latest >= 0
+                entry_codes = np.array(
+                    [_CFD_STATUS_INDEX.get(entry["status"], -1) for entry in entries],
+                    dtype=int,
+                )
+                codes[seen] = entry_codes[latest[seen]]
+
+            # Statuses outside the diagram's categories are not counted
+            counted = codes >= 0
+            counts[codes[counted], np.flatnonzero(counted)] += 1
 
-        # Initialize data structures
         status_counts = {
-            "planned": [0] * len(dates),
-            "in_progress": [0] * len(dates),
-            "completed": [0] * len(dates),
-            "on_hold": [0] * len(dates),
-            "cancelled": [0] * len(dates),
+            status: counts[i].tolist() for i, status in enumerate(_CFD_STATUSES)
         }
 
-        completion_percentage = [0] * len(dates)
-
-        # For each date, count tasks in each status
-        for i, date in enumerate(dates):
-            # Calculate status counts for this date
-            for task_id in self.tasks:
-                if task_id not in tasks_dict:
-                    continue
-
-                task = tasks_dict[task_id]
-
-                # Determine task status on this date
-                task_status = "planned"  # Default status
-
-                # Check if task has started by this date
-                if (
-                    hasattr(task, "actual_start_date")
-                    and task.actual_start_date is not None
-                ):
-                    if task.actual_start_date <= date:
-                        # Task has started by this date
-
-                        # Check if task has completed by this date
-                        if (
-                            hasattr(task, "actual_end_date")
-                            and task.actual_end_date is not None
-                            and task.actual_end_date <= date
-                        ):
-                            task_status = "completed"
-                        else:
-                            # Task has started but not completed
-                            task_status = "in_progress"
-
-                            # Check if task is on hold
-                            if hasattr(task, "status") and task.status == "on_hold":
-                                task_status = "on_hold"
-
-                # For historical dates, try to determine from progress history
-                if hasattr(task, "progress_history") and task.progress_history:
-                    # Find the most recent status update before or on this date
-                    for entry in reversed(task.progress_history):
-                        if entry["date"] <= date and "status" in entry:
-                            task_status = entry["status"]
-                            break
-
-                # Increment counter for this status
-                if task_status in status_counts:
-                    status_counts[task_status][i] += 1
-
-            # Calculate completion percentage for this date
-            if self.status_history:
-                # Find the most recent status update before or on this date
-                for entry in reversed(self.status_history):
-                    if entry["date"] <= date:
-                        completion_percentage[i] = entry["completion_percentage"]
-                        break
+        # Completion percentage from the most recent chain status update
+        # before or on each date
+        completion = np.zeros(day_count)
+        entries = [entry for entry in self.status_history if entry["date"] is not None]
+        if entries:
+            latest = _latest_visible(
+                [first_day_on_or_after(start_date, entry["date"]) for entry in entries],
+                day_count,
+            )
+            seen = latest >= 0
+            values = np.array([entry["completion_percentage"] for entry in entries])
+            completion[seen] = values[latest[seen]]
+        completion_percentage = completion.tolist()
 
         return {
             "dates": date_strs,
@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
 
+from ccpm.utils.day_keys import day_key
+
 
 class ResourceOverallocationError(ValueError):
     """Exception raised when trying to allocate more resource units than available."""
@@ -61,7 +63,7 @@ class Resource:
         Returns:
             float: Units deallocated, or 0 if no allocation existed
         """
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = day_key(date)
 
         # Check if there's an allocation to remove
         if date_str in self.allocations and task_id in self.allocations[date_str]:
@@ -120,7 +122,7 @@ class Resource:
         current_date = start_date
 
         while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
+            date_str = day_key(current_date)
 
             # Get total capacity for this date
             total_capacity = self.calendar.get(date_str, self.capacity)
@@ -157,7 +159,7 @@ class Resource:
             date: The date to set capacity for
             capacity: Available capacity on this date
         """
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = day_key(date)
         self.calendar[date_str] = capacity
 
     def deallocate_for_task(self, task_id, start_date=None, end_date=None):
@@ -206,7 +208,7 @@ class Resource:
         Returns:
             dict: Task IDs and allocation units {task_id: units}
         """
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = day_key(date)
         return self.allocations.get(date_str, {}).copy()
 
     def get_available_capacity(self, date):
@@ -220,7 +222,7 @@ class Resource:
             float: Available units of this resource
         """
         # Get total capacity for this date (default to standard capacity)
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = day_key(date)
         total_capacity = self.calendar.get(date_str, self.capacity)
 
         # Get existing allocations for this date
@@ -245,7 +247,7 @@ class Resource:
         Raises:
             ValueError: If allocation would exceed capacity and overallocation is not allowed
         """
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = day_key(date)
 
         # Check if there's enough available capacity
         available = self.get_available_capacity(date)
@@ -308,14 +310,14 @@ class Resource:
         """
         # For a single date
         if date:
-            date_str = date.strftime("%Y-%m-%d")
+            date_str = day_key(date)
             return date_str in self.overallocations
 
         # For a period
         if start_date and end_date:
             current_date = start_date
             while current_date <= end_date:
-                date_str = current_date.strftime("%Y-%m-%d")
+                date_str = day_key(current_date)
                 if date_str in self.overallocations:
                     return True
                 current_date += timedelta(days=1)
@@ -464,7 +466,7 @@ class Resource:
         self.arrivals.append({"date": date, "task_id": task_id, "state": state})
 
         # Update work in progress
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = day_key(date)
         if date_str not in self.work_in_progress:
             self.work_in_progress[date_str] = {}
 
@@ -482,7 +484,7 @@ class Resource:
         self.departures.append({"date": date, "task_id": task_id, "state": state})
 
         # Update work in progress (remove the task)
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = day_key(date)
 
         # Create a copy of all previous dates' WIP for this date
         if date_str not in self.work_in_progress:
@@ -516,7 +518,7 @@ class Resource:
             date: Date when the state changed
             state: New state of the work
         """
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = day_key(date)
 
         # Create a copy of all previous dates' WIP for this date if it doesn't exist
         if date_str not in self.work_in_progress:
@@ -646,7 +648,7 @@ class Resource:
             dates.append(current_date)
             current_date += timedelta(days=1)
 
-        date_strs = [date.strftime("%Y-%m-%d") for date in dates]
+        date_strs = [day_key(date) for date in dates]
 
         # Initialize data structures
         arrivals_cumulative = []
@@ -800,7 +802,7 @@ class Resource:
 
     def _get_wip_for_date(self, date):
         """Helper method to get WIP for a specific date, handling missing dates"""
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = day_key(date)
 
         # If we have WIP recorded for this date, use it
         if date_str in self.work_in_progress:
@@ -856,7 +858,7 @@ class Resource:
         if end_date:
             self.planned_assignments[task_id]["planned_end"] = end_date
             """Helper method to get WIP for a specific date, handling missing dates"""
-            date_str = date.strftime("%Y-%m-%d")
+            date_str = day_key(date)
 
             # If we have WIP recorded for this date, use it
             if date_str in self.work_in_progress:
@@ -2,6 +2,8 @@ from datetime import datetime, timedelta
 from enum import Enum, auto
 from typing import List, Dict, Union, Optional, Any
 
+from ccpm.utils.day_keys import day_key
+
 
 class TaskStatus(Enum):
     """
@@ -147,8 +149,11 @@ class Task:
         self.new_end_date = None  # Updated planned end
         self.actual_start_date = None
         self.actual_end_date = None
+        self.expected_end_date = None  # Forecast end while in progress
+        self.actual_duration = None
 
         # Progress tracking
+        self.original_duration = None  # Planned duration when work started
         self.remaining_duration = self.planned_duration
         self.progress_history = []
 
@@ -317,7 +322,7 @@ class Task:
         self.new_start_date = start_date
 
         # Store original duration for later calculations
-        if not hasattr(self, "original_duration"):
+        if self.original_duration is None:
             self.original_duration = self.planned_duration
 
         # Add to progress history
@@ -367,7 +372,7 @@ class Task:
         self.remaining_duration = float(remaining_duration)
 
         # Calculate progress
-        if not hasattr(self, "original_duration"):
+        if self.original_duration is None:
             self.original_duration = self.planned_duration
 
         # Calculate completion percentage
@@ -544,7 +549,7 @@ class Task:
         if self._status == TaskStatus.COMPLETED:
             return 100.0
 
-        if not hasattr(self, "original_duration") or self.original_duration <= 0:
+        if self.original_duration is None or self.original_duration <= 0:
             # Fall back to planned duration if original not available
             duration = self.planned_duration
         else:
@@ -566,7 +571,7 @@ class Task:
         if self._status == TaskStatus.PLANNED:
             return 0
 
-        if self._status == TaskStatus.COMPLETED and hasattr(self, "actual_duration"):
+        if self._status == TaskStatus.COMPLETED and self.actual_duration is not None:
             return self.actual_duration
 
         if not self.actual_start_date:
@@ -591,7 +596,7 @@ class Task:
         if self._status == TaskStatus.PLANNED:
             return 0
 
-        if not hasattr(self, "original_duration") or not self.actual_start_date:
+        if self.original_duration is None or not self.actual_start_date:
             return 0
 
         if self._status == TaskStatus.COMPLETED and self.actual_end_date:
@@ -634,7 +639,7 @@ class Task:
             return self.actual_end_date
 
         if self._status == TaskStatus.IN_PROGRESS:
-            if hasattr(self, "expected_end_date") and self.expected_end_date:
+            if self.expected_end_date:
                 return self.expected_end_date
             elif self.actual_start_date and self.remaining_duration is not None:
                 # Calculate from remaining duration
@@ -982,9 +987,6 @@ class Task:
             status_change: Description of status change if any
             note: Optional note
         """
-        if not hasattr(self, "progress_history"):
-            self.progress_history = []
-
         # Calculate elapsed days
         elapsed_days = 0
         if self.actual_start_date:
@@ -993,7 +995,7 @@ class Task:
         # Calculate progress percentage if not provided
         if (
             progress_percentage is None
-            and hasattr(self, "original_duration")
+            and self.original_duration is not None
             and self.original_duration > 0
         ):
             completed = self.original_duration - remaining
@@ -1235,12 +1237,22 @@ class Task:
 
     def copy(self) -> "Task":
         """
-        Create a deep copy of this task.
+        Create a copy of this task that can be modified independently.
+
+        Unlike a to_dict()/from_dict() round trip this keeps the full state,
+        including resource allocations, progress history and notes.
 
         Returns:
             Task: New task instance with the same properties
         """
-        return self.from_dict(self.to_dict())
+        task = self.__class__.__new__(self.__class__)
+        # Copy containers one level deep; the entries they hold (dates, note
+        # and progress records) are never modified in place
+        task.__dict__.update(
+            (attr, value.copy() if isinstance(value, (list, dict)) else value)
+            for attr, value in self.__dict__.items()
+        )
+        return task
 
     def __repr__(self) -> str:
         """
@@ -1303,7 +1315,7 @@ class Task:
             dates.append(current_date)
             current_date += timedelta(days=1)
 
-        date_strs = [date.strftime("%Y-%m-%d") for date in dates]
+        date_strs = [day_key(date) for date in dates]
 
         # Get all status transitions from history
         transitions = []
@@ -1313,15 +1325,15 @@ class Task:
         initial_status = "planned"
         initial_date = self.start_date
         if initial_date and initial_date < start_date:
-            status_at_date[initial_date.strftime("%Y-%m-%d")] = initial_status
+            status_at_date[day_key(initial_date)] = initial_status
 
         # Extract status changes from progress history
-        if hasattr(self, "progress_history"):
+        if self.progress_history:
             for entry in self.progress_history:
                 if "status_change" in entry or "status" in entry:
                     date = entry["date"]
                     new_status = entry.get("status", initial_status)
-                    date_str = date.strftime("%Y-%m-%d")
+                    date_str = day_key(date)
 
                     # Skip if before our range
                     if date < start_date:
@@ -1361,7 +1373,7 @@ class Task:
 
         # For each date, determine the task's status
         for date in dates:
-            date_str = date.strftime("%Y-%m-%d")
+            date_str = day_key(date)
             current_status = None
 
             # Find the latest status before or on this date
@@ -1450,7 +1462,7 @@ class Task:
                 metrics["lead_time"] = (self.actual_end_date - self.start_date).days
 
         # Calculate time spent in each status
-        if hasattr(self, "progress_history") and self.progress_history:
+        if self.progress_history:
             status_periods = {}
             current_status = None
             current_start = None
@@ -1539,7 +1551,7 @@ class Task:
             dates.append(current_date)
             current_date += timedelta(days=1)
 
-        date_strs = [date.strftime("%Y-%m-%d") for date in dates]
+        date_strs = [day_key(date) for date in dates]
 
         # Get all status transitions from history
         transitions = []
@@ -1549,15 +1561,15 @@ class Task:
         initial_status = "planned"
         initial_date = self.start_date
         if initial_date and initial_date < start_date:
-            status_at_date[initial_date.strftime("%Y-%m-%d")] = initial_status
+            status_at_date[day_key(initial_date)] = initial_status
 
         # Extract status changes from progress history
-        if hasattr(self, "progress_history"):
+        if self.progress_history:
             for entry in self.progress_history:
                 if "status_change" in entry:
                     date = entry["date"]
                     new_status = entry["status"]
-                    date_str = date.strftime("%Y-%m-%d")
+                    date_str = day_key(date)
 
                     # Skip if before our range
                     if date < start_date:
@@ -1591,7 +1603,7 @@ class Task:
 
         # For each date, determine the task's status
         for date in dates:
-            date_str = date.strftime("%Y-%m-%d")
+            date_str = day_key(date)
             current_status = None
 
             # Find the latest status before or on this date
@@ -1661,7 +1673,7 @@ class Task:
                 metrics["lead_time"] = (self.actual_end_date - self.start_date).days
 
         # Calculate time spent in each status
-        if hasattr(self, "progress_history") and self.progress_history:
+        if self.progress_history:
             status_periods = {}
             current_status = None
             current_start = None
@@ -1737,7 +1749,7 @@ class Task:
             dates.append(current_date)
             current_date += timedelta(days=1)
 
-        date_strs = [date.strftime("%Y-%m-%d") for date in dates]
+        date_strs = [day_key(date) for date in dates]
 
         # Initialize aggregated data structure
         possible_statuses = [s.value for s in TaskStatus]
@@ -1809,7 +1821,7 @@ class Task:
 
         for task in completed_tasks:
             if period == "day":
-                period_key = task.actual_end_date.strftime("%Y-%m-%d")
+                period_key = day_key(task.actual_end_date)
             elif period == "week":
                 period_key = task.actual_end_date.strftime("%Y-W%W")
             elif period == "month":
@@ -1895,7 +1907,7 @@ class Task:
             dates.append(current_date)
             current_date += timedelta(days=1)
 
-        date_strs = [date.strftime("%Y-%m-%d") for date in dates]
+        date_strs = [day_key(date) for date in dates]
 
         # Initialize aggregated data structure
         possible_statuses = [s.value for s in TaskStatus]
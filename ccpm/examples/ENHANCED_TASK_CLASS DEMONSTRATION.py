@@ -31,7 +31,7 @@ def print_task_info(task, label=None):
     if task.get_end_date():
         print(f"End Date: {task.get_end_date().strftime('%Y-%m-%d')}")
 
-    if hasattr(task, "original_duration"):
+    if task.original_duration is not None:
         print(f"Original Duration: {task.original_duration} days")
 
     print(f"Planned Duration: {task.planned_duration} days")
@@ -121,11 +121,13 @@ def resolve_resource_conflicts(critical_path, tasks, resources, task_graph=None)
     if not conflict_graph.edges:
         return critical_path
 
-    # Get tasks in topological order to establish priority
-    topo_order = list(nx.topological_sort(task_graph))
-
-    # Create a priority map for sorting (lower number = higher priority)
-    task_priority = {task_id: topo_order.index(task_id) for task_id in critical_path}
+    # Create a priority map from the topological order (lower number = higher priority)
+    critical_set = set(critical_path)
+    task_priority = {
+        task_id: position
+        for position, task_id in enumerate(nx.topological_sort(task_graph))
+        if task_id in critical_set
+    }
 
     # Sort critical path tasks by priority
     sorted_critical_tasks = sorted(
@@ -43,8 +43,7 @@ def identify_feeding_chains(tasks, critical_chain, task_graph=None):
 
     # For each critical task, find its non-critical predecessors
     for critical_task_id in critical_task_ids:
-        predecessors = list(task_graph.predecessors(critical_task_id))
-        for pred_id in predecessors:
+        for pred_id in task_graph.predecessors(critical_task_id):
             if pred_id not in critical_set and pred_id in tasks:
                 if critical_task_id not in feeding_points:
                     feeding_points[critical_task_id] = []
@@ -1,10 +1,15 @@
+from collections import deque
+import heapq
 from datetime import datetime, timedelta
-import networkx as nx
+from functools import lru_cache
+import numbers
+import numpy as np
 
 from ccpm.domain.task import Task
 from ccpm.domain.buffer import Buffer
 from ccpm.domain.chain import Chain
 from ccpm.utils.graph import (
+    DAG,
     build_dependency_graph,
     forward_pass,
     backward_pass,
@@ -31,8 +36,22 @@ from ..utils.tag_utils import (
     get_tasks_by_tags,
 )
 
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+# Task statuses for which work has begun
+_STARTED_STATUSES = frozenset(("completed", "in_progress"))
+
+
+@lru_cache(maxsize=4096)
+def _days(n):
+    """Return a shared timedelta of n days (n may be negative or fractional)."""
+    return timedelta(days=n)
+
 
 class CCPMScheduler:
+    # Stages of schedule(), in pipeline order
+    _STAGES = ("graph", "baseline", "critical_chain", "feeding", "leveling", "buffers")
+
     def __init__(
         self,
         project_buffer_ratio=0.5,
@@ -41,12 +60,18 @@ class CCPMScheduler:
         default_feeding_buffer_strategy=None,
         allow_resource_overallocation=False,
     ):
+        # Pipeline stages whose inputs changed since they last ran
+        self._dirty = dict.fromkeys(self._STAGES, True)
+
         self.allow_resource_overallocation = allow_resource_overallocation  # Allow over allocation and report on it with a view to topping up capacity
         self.tasks = {}  # Dictionary of Task objects
         self.chains = {}  # Dictionary of Chain objects
         self.buffers = {}  # Dictionary of Buffer objects
         self.resources = []  # List of resource names
 
+        # Whether every task has a start and end date
+        self._task_dates_initialized = False
+
         self.project_buffer_ratio = project_buffer_ratio
         self.default_feeding_buffer_ratio = default_feeding_buffer_ratio
 
@@ -70,15 +95,98 @@ class CCPMScheduler:
         # Graph representation
         self.task_graph = None
 
+        # Caches derived from task_graph, rebuilt after graph mutations
+        self._topo_cache = None  # Topological order of the graph nodes
+        self._topo_rank = None  # node -> position in the topological order
+        self._preds = None  # node -> list of predecessor nodes
+        self._succs = None  # node -> list of successor nodes
+        self._dag = None  # DAG view of _succs/_preds for the schedule passes
+        self._graph_dirty = True
+        self._cached_graph = None  # The task_graph object the caches describe
+
         # Start date
         self.start_date = datetime.now()
 
         # Current execution date for tracking progress
         self.execution_date = None
 
+    @property
+    def start_date(self):
+        """Get the project start date."""
+        return self._start_date
+
+    @start_date.setter
+    def start_date(self, value):
+        """Set the project start date; the next schedule() reruns in full."""
+        self._start_date = value
+        self._mark_stage_dirty("graph")
+
+    @property
+    def resources(self):
+        """Get the resources available for the project."""
+        return self._resources
+
+    @resources.setter
+    def resources(self, value):
+        """Set the project resources; the next schedule() reruns in full."""
+        self._resources = value
+        self._mark_stage_dirty("graph")
+
+    @property
+    def project_buffer_ratio(self):
+        """Get the buffer ratio used to size the project buffer."""
+        return self._project_buffer_ratio
+
+    @project_buffer_ratio.setter
+    def project_buffer_ratio(self, value):
+        """Set the project buffer ratio; the next schedule() reruns in full."""
+        self._project_buffer_ratio = value
+        self._mark_stage_dirty("graph")
+
+    @property
+    def default_feeding_buffer_ratio(self):
+        """Get the buffer ratio given to new feeding chains."""
+        return self._default_feeding_buffer_ratio
+
+    @default_feeding_buffer_ratio.setter
+    def default_feeding_buffer_ratio(self, value):
+        """Set the feeding buffer ratio; the next schedule() reruns in full."""
+        self._default_feeding_buffer_ratio = value
+        self._mark_stage_dirty("graph")
+
+    @property
+    def project_buffer_strategy(self):
+        """Get the strategy used to size the project buffer."""
+        return self._project_buffer_strategy
+
+    @project_buffer_strategy.setter
+    def project_buffer_strategy(self, value):
+        """Set the project buffer strategy; the next schedule() reruns in full."""
+        self._project_buffer_strategy = value
+        self._mark_stage_dirty("graph")
+
+    @property
+    def default_feeding_buffer_strategy(self):
+        """Get the strategy given to new feeding chains."""
+        return self._default_feeding_buffer_strategy
+
+    @default_feeding_buffer_strategy.setter
+    def default_feeding_buffer_strategy(self, value):
+        """Set the feeding buffer strategy; the next schedule() reruns in full."""
+        self._default_feeding_buffer_strategy = value
+        self._mark_stage_dirty("graph")
+
     def add_task(self, task):
         """Add a task to the scheduler"""
         self.tasks[task.id] = task
+        self._mark_stage_dirty("graph")
+        return self
+
+    def add_tasks(self, tasks):
+        """Add several tasks to the scheduler, invalidating the schedule once"""
+        for task in tasks:
+            self.tasks[task.id] = task
+        self._mark_stage_dirty("graph")
         return self
 
     def set_resources(self, resources):
@@ -94,19 +202,81 @@ class CCPMScheduler:
     def build_dependency_graph(self):
         """Build a directed graph representing task dependencies, including buffers."""
         self.task_graph = build_dependency_graph(self.tasks)
+        self._invalidate_graph_caches()
+        self._mark_stage_done("graph")
         return self.task_graph
 
+    def _mark_stage_dirty(self, stage):
+        """Mark a pipeline stage, and every stage after it, as needing a rerun."""
+        stages = self._STAGES[self._STAGES.index(stage) :]
+        for later in stages:
+            self._dirty[later] = True
+
+        # A new baseline may leave tasks without dates again
+        if "baseline" in stages:
+            self._task_dates_initialized = False
+
+    def _mark_stage_done(self, stage):
+        """Mark a pipeline stage as current; the stages after it become stale."""
+        self._mark_stage_dirty(stage)
+        self._dirty[stage] = False
+
+    def _invalidate_graph_caches(self):
+        """Mark caches derived from task_graph as stale after it is mutated."""
+        self._graph_dirty = True
+
+    def _refresh_graph_caches(self):
+        """Rebuild the topological order and adjacency lists of task_graph if stale."""
+        # A reassigned task_graph invalidates the caches just like a mutation
+        if not self._graph_dirty and self._cached_graph is self.task_graph:
+            return
+
+        graph = self.task_graph
+        # One pass over the adjacency dicts; predecessor lists are derived from
+        # the successor lists rather than read through networkx's views
+        self._succs = {node: list(nbrs) for node, nbrs in graph.adjacency()}
+        self._preds = {node: [] for node in self._succs}
+        for node, successors in self._succs.items():
+            for succ_id in successors:
+                self._preds[succ_id].append(node)
+
+        self._dag = DAG(self._succs, self._preds)
+        self._topo_cache = self._dag.topological_sort()
+        self._topo_rank = {node: i for i, node in enumerate(self._topo_cache)}
+
+        self._graph_dirty = False
+        self._cached_graph = graph
+
+    def _get_topological_order(self):
+        """Return the cached topological order of task_graph."""
+        self._refresh_graph_caches()
+        return self._topo_cache
+
+    def _get_predecessors(self, node):
+        """Return the cached predecessor list of a task_graph node."""
+        self._refresh_graph_caches()
+        return self._preds[node]
+
+    def _get_successors(self, node):
+        """Return the cached successor list of a task_graph node."""
+        self._refresh_graph_caches()
+        return self._succs[node]
+
     def calculate_baseline_schedule(self):
         """Calculate the baseline schedule (early/late start/finish)"""
         if not self.task_graph:
             self.build_dependency_graph()
 
+        # Both passes share the cached adjacency lists and topological order
+        self._refresh_graph_caches()
+
         # Calculate early start/finish
-        forward_pass(self.task_graph, self.tasks)
+        forward_pass(self._dag, self.tasks)
 
         # Calculate late start/finish and identify critical path
-        backward_pass(self.task_graph, self.tasks)
+        backward_pass(self._dag, self.tasks)
 
+        self._mark_stage_done("baseline")
         return self.tasks
 
     def calculate_critical_chain(self):
@@ -118,7 +288,7 @@ class CCPMScheduler:
             self.build_dependency_graph()
 
         # Calculate schedule if not already done
-        if not all(hasattr(task, "early_start") for task in self.tasks.values()):
+        if self._dirty["baseline"]:
             self.calculate_baseline_schedule()
 
         # Use the critical_chain service to identify the critical chain
@@ -134,10 +304,11 @@ class CCPMScheduler:
             # Update critical chain with resolved path
             self.critical_chain.tasks = resolved_path
             # Update chain membership for tasks
-            for task_id in self.tasks:
-                if task_id in resolved_path:
-                    self.tasks[task_id].chain_id = self.critical_chain.id
-                    self.tasks[task_id].chain_type = "critical"
+            for task_id in resolved_path:
+                task = self.tasks.get(task_id)
+                if task is not None:
+                    task.chain_id = self.critical_chain.id
+                    task.chain_type = "critical"
 
         # Add critical chain to chains dictionary
         self.chains[self.critical_chain.id] = self.critical_chain
@@ -178,6 +349,10 @@ class CCPMScheduler:
             )
             self.task_graph.add_edge(last_critical_task, buffer_id)
 
+        # Resource conflict resolution and the buffer node changed the graph
+        self._invalidate_graph_caches()
+        self._mark_stage_done("critical_chain")
+
         return self.critical_chain
 
     def find_feeding_chains(self):
@@ -202,6 +377,7 @@ class CCPMScheduler:
             # Add to dictionary
             self.chains[chain.id] = chain
 
+        self._mark_stage_done("feeding")
         return feeding_chains
 
     def calculate_buffers(self):
@@ -218,7 +394,7 @@ class CCPMScheduler:
 
             # Get tasks in this chain
             chain_tasks = [
-                self.tasks[task_id] for task_id in chain.tasks if task_id in self.tasks
+                task for task in map(self.tasks.get, chain.tasks) if task is not None
             ]
 
             if not chain_tasks:
@@ -263,59 +439,133 @@ class CCPMScheduler:
                 # Add connections through buffer
                 self.task_graph.add_edge(last_feeding_task, buffer_id)
                 self.task_graph.add_edge(buffer_id, connects_to)
+                self._invalidate_graph_caches()
 
         return self.buffers
 
-    def schedule(self):
-        """Run the full CCPM scheduling algorithm."""
+    def schedule(self, incremental=False):
+        """
+        Run the CCPM scheduling algorithm.
+
+        By default every stage runs. With incremental=True, only the stages
+        marked dirty since the last run are executed. The scheduler marks
+        them when tasks are added, when start_date, resources or the buffer
+        ratios and strategies are assigned, and on progress updates. Edits
+        made inside a task, chain or resource object, or to the resource
+        list in place, are not tracked; run a full schedule() after them.
+
+        Args:
+            incremental: Skip the stages whose inputs have not changed
+
+        Returns:
+            dict: The tasks, chains and buffers of the schedule
+        """
+        if not incremental:
+            self._mark_stage_dirty("graph")
+
         # Build the dependency graph
-        self.build_dependency_graph()
+        if self._dirty["graph"]:
+            self.build_dependency_graph()
 
         # Calculate the initial schedule
-        self.calculate_baseline_schedule()
+        if self._dirty["baseline"]:
+            self.calculate_baseline_schedule()
 
         # Identify the critical chain
-        self.calculate_critical_chain()
+        if self._dirty["critical_chain"]:
+            self.calculate_critical_chain()
 
         # Identify feeding chains before resource leveling
         # This allows the resource leveling algorithm to properly schedule
         # feeding chain tasks as late as possible (ALAP)
-        self.find_feeding_chains()
+        if self._dirty["feeding"]:
+            self.find_feeding_chains()
 
         # Apply resource leveling
         # Use the resource_leveling service
-        if self.resources:
-            self.tasks, self.task_graph = level_resources(
-                self.tasks, self.resources, self.critical_chain, self.task_graph
-            )
+        if self._dirty["leveling"]:
+            if self.resources:
+                self.tasks, self.task_graph = level_resources(
+                    self.tasks, self.resources, self.critical_chain, self.task_graph
+                )
+                self._invalidate_graph_caches()
+            self._mark_stage_done("leveling")
 
-        # Set actual dates for all tasks
-        for task_id, task in self.tasks.items():
-            if not hasattr(task, "start_date") or task.start_date is None:
-                task.start_date = self.start_date + timedelta(days=task.early_start)
-                task.end_date = task.start_date + timedelta(days=task.planned_duration)
+        if self._dirty["buffers"]:
+            # Set actual dates for all tasks
+            self._initialize_task_dates()
 
-        # Calculate and add feeding buffers to the network
-        self.calculate_buffers()
+            # Calculate and add feeding buffers to the network
+            self.calculate_buffers()
 
-        # Update schedule with buffers
-        self.apply_buffer_to_schedule()
+            # Update schedule with buffers
+            self.apply_buffer_to_schedule()
+            self._mark_stage_done("buffers")
 
         return {"tasks": self.tasks, "chains": self.chains, "buffers": self.buffers}
 
+    def _assign_baseline_dates(self, tasks):
+        """
+        Set start/end dates from early start offsets for a batch of tasks.
+
+        The day offsets are converted to timedeltas in one vectorized pass.
+        Fractional days are kept at microsecond resolution, matching
+        timedelta(days=...). The offsets are added to the Python start date,
+        so a timezone-aware start date keeps its timezone.
+
+        Args:
+            tasks: List of Task objects whose dates should be assigned
+        """
+        if not tasks:
+            return
+
+        early_starts = np.fromiter(
+            (task.early_start for task in tasks), dtype=np.float64, count=len(tasks)
+        )
+        durations = np.fromiter(
+            (task.planned_duration for task in tasks),
+            dtype=np.float64,
+            count=len(tasks),
+        )
+
+        start_offsets = np.round(early_starts * _MICROSECONDS_PER_DAY).astype(
+            "timedelta64[us]"
+        )
+        duration_offsets = np.round(durations * _MICROSECONDS_PER_DAY).astype(
+            "timedelta64[us]"
+        )
+
+        base = self.start_date
+        for task, start_offset, duration in zip(
+            tasks, start_offsets.tolist(), duration_offsets.tolist()
+        ):
+            task.start_date = base + start_offset
+            task.end_date = task.start_date + duration
+
+    def _initialize_task_dates(self):
+        """Give every task a start and end date, keeping dates already set."""
+        undated = []
+        for task in self.tasks.values():
+            if task.start_date is None:
+                undated.append(task)
+            elif task.end_date is None:
+                task.end_date = task.start_date + _days(task.planned_duration)
+
+        self._assign_baseline_dates(undated)
+        self._task_dates_initialized = True
+
     def apply_buffer_to_schedule(self):
         """Update the schedule to account for buffers, positioning feeding buffers ALAP."""
         if not hasattr(self, "buffers"):
             return
 
         # First, ensure all tasks have start and end dates
-        for task_id, task in self.tasks.items():
-            if task.start_date is None:
-                task.start_date = self.start_date + timedelta(days=task.early_start)
-            if task.end_date is None:
-                task.end_date = task.start_date + timedelta(days=task.planned_duration)
+        if not self._task_dates_initialized:
+            self._initialize_task_dates()
 
-        # Now process each buffer
+        # Delays for critical tasks are collected and applied in one pass
+        placements = []
+        pending_delays = {}
         for buffer_id, buffer in self.buffers.items():
             if buffer.buffer_type == "project":
                 # Project buffer comes after the last task in critical chain
@@ -328,67 +578,135 @@ class CCPMScheduler:
 
                 # Set buffer dates
                 buffer.start_date = last_task.end_date
-                buffer.end_date = buffer.start_date + timedelta(days=buffer.size)
+                buffer.end_date = buffer.start_date + _days(buffer.size)
+                continue
 
-            elif buffer.buffer_type == "feeding":
-                # Feeding buffer comes between feeding chain and critical chain
-                # Get the predecessor task (last in feeding chain) and successor task (on critical chain)
-                predecessors = list(self.task_graph.predecessors(buffer_id))
-                successors = list(self.task_graph.successors(buffer_id))
+            if buffer.buffer_type != "feeding":
+                continue
 
-                if not predecessors or not successors:
-                    continue  # Skip if buffer isn't properly connected
+            # Feeding buffer comes between feeding chain and critical chain
+            # Get the predecessor task (last in feeding chain) and successor task (on critical chain)
+            predecessors = self._get_predecessors(buffer_id)
+            successors = self._get_successors(buffer_id)
 
-                predecessor_task_id = predecessors[0]
-                successor_task_id = successors[0]
+            if not predecessors or not successors:
+                continue  # Skip if buffer isn't properly connected
 
-                predecessor_task = self.tasks[predecessor_task_id]
-                successor_task = self.tasks[successor_task_id]
+            predecessor_task = self.tasks[predecessors[0]]
+            successor_task_id = successors[0]
+            successor_task = self.tasks[successor_task_id]
+            placements.append((buffer, predecessor_task, successor_task))
 
-                # For ALAP positioning:
-                # Calculate backward from when the critical task starts
-                # Buffer end date should be the successor start date
-                buffer.end_date = successor_task.start_date
+            # If the buffer cannot fit before the critical task starts,
+            # we need to delay the critical task
+            delay = self._position_feeding_buffer(
+                buffer, predecessor_task, successor_task
+            )
+            if delay > 0:
+                pending_delays[successor_task_id] = max(
+                    pending_delays.get(successor_task_id, 0), delay
+                )
 
-                # Buffer start date is end date minus buffer size
-                buffer.start_date = buffer.end_date - timedelta(days=buffer.size)
+        # A delay can move a buffer's predecessor as well as its successor,
+        # so reposition every buffer and delay again until all of them fit
+        while self._delay_tasks_and_dependents(pending_delays):
+            pending_delays = {}
+            for buffer, predecessor_task, successor_task in placements:
+                delay = self._position_feeding_buffer(
+                    buffer, predecessor_task, successor_task
+                )
+                if delay > 0:
+                    successor_task_id = successor_task.id
+                    pending_delays[successor_task_id] = max(
+                        pending_delays.get(successor_task_id, 0), delay
+                    )
 
-                # Check if the buffer start date is after the predecessor end date
-                # If not, we need to adjust it and possibly delay the critical task
-                if buffer.start_date < predecessor_task.end_date:
-                    # Need to move buffer start date to right after predecessor ends
-                    buffer.start_date = predecessor_task.end_date
-                    buffer.end_date = buffer.start_date + timedelta(days=buffer.size)
+        return self.tasks
 
-                    # If this pushes the buffer end past the critical task start,
-                    # we need to delay the critical task
-                    if buffer.end_date > successor_task.start_date:
-                        delay = (buffer.end_date - successor_task.start_date).days
-                        self._delay_task_and_dependents(successor_task_id, delay)
+    @staticmethod
+    def _position_feeding_buffer(buffer, predecessor_task, successor_task):
+        """
+        Place a feeding buffer as late as possible before its successor.
 
-        return self.tasks
+        Returns:
+            int: Days the successor must be delayed for the buffer to fit
+        """
+        # For ALAP positioning:
+        # Calculate backward from when the critical task starts
+        # Buffer end date should be the successor start date
+        buffer.end_date = successor_task.start_date
 
-    def _delay_task_and_dependents(self, task_id, delay_days):
-        """Recursively delay a task and all its dependent tasks by a number of days."""
-        if delay_days <= 0 or task_id not in self.tasks:
-            return
+        # Buffer start date is end date minus buffer size
+        buffer.start_date = buffer.end_date - _days(buffer.size)
 
-        task = self.tasks[task_id]
+        # Check if the buffer start date is after the predecessor end date
+        # If not, we need to adjust it and possibly delay the critical task
+        if buffer.start_date < predecessor_task.end_date:
+            # Need to move buffer start date to right after predecessor ends
+            buffer.start_date = predecessor_task.end_date
+            buffer.end_date = buffer.start_date + _days(buffer.size)
 
-        # Delay this task
-        task.start_date += timedelta(days=delay_days)
-        task.end_date += timedelta(days=delay_days)
+            # If this pushes the buffer end past the critical task start,
+            # the critical task has to move
+            if buffer.end_date > successor_task.start_date:
+                return (buffer.end_date - successor_task.start_date).days
 
-        # Recursively delay all dependent tasks
-        if self.task_graph:
-            for succ_id in self.task_graph.successors(task_id):
-                if succ_id in self.tasks:
-                    self._delay_task_and_dependents(succ_id, delay_days)
-                elif succ_id in self.buffers:
-                    # If successor is a buffer, move it too
-                    buffer = self.buffers[succ_id]
-                    buffer.start_date += timedelta(days=delay_days)
-                    buffer.end_date += timedelta(days=delay_days)
+        return 0
+
+    def _delay_tasks_and_dependents(self, pending_delays):
+        """Delay tasks and all their dependent tasks.
+
+        Each task is shifted once, by the largest delay requested for it or
+        for any task upstream of it, in a single topological pass. Buffers
+        directly after a delayed task move with it but do not pass the delay
+        on to their own successors.
+
+        Args:
+            pending_delays: Dictionary mapping task IDs to delays in days
+
+        Returns:
+            dict: Delay in days applied to each shifted task
+        """
+        pending_delays = {
+            task_id: delay
+            for task_id, delay in pending_delays.items()
+            if delay > 0 and task_id in self.tasks
+        }
+        if not pending_delays:
+            return {}
+
+        if not self.task_graph:
+            for task_id, delay in pending_delays.items():
+                task = self.tasks[task_id]
+                task.start_date += _days(delay)
+                task.end_date += _days(delay)
+            return pending_delays
+
+        # Nothing before the earliest delayed task can be affected
+        order = self._get_topological_order()
+        first = min(self._topo_rank[task_id] for task_id in pending_delays)
+
+        node_delays = {}
+        for node in order[first:]:
+            delay = pending_delays.get(node, 0)
+            for pred_id in self._preds[node]:
+                delay = max(delay, node_delays.get(pred_id, 0))
+            if delay <= 0:
+                continue
+
+            delta = _days(delay)
+            if node in self.tasks:
+                node_delays[node] = delay
+                task = self.tasks[node]
+                task.start_date += delta
+                task.end_date += delta
+            elif node in self.buffers:
+                buffer = self.buffers[node]
+                if buffer.start_date is not None:
+                    buffer.start_date += delta
+                    buffer.end_date += delta
+
+        return node_delays
 
     def set_execution_date(self, execution_date):
         """
@@ -407,7 +725,9 @@ class CCPMScheduler:
 
         return execution_date
 
-    def update_task_progress(self, task_id, remaining_duration, status_date=None):
+    def update_task_progress(
+        self, task_id, remaining_duration, status_date=None, recalculate=True
+    ):
         """
         Update task progress during execution phase.
 
@@ -415,6 +735,9 @@ class CCPMScheduler:
             task_id: The ID of the task to update
             remaining_duration: The remaining duration in days
             status_date: The date of this update (defaults to execution_date or today)
+            recalculate: Whether to recalculate the network and buffer consumption
+                now; pass False when updating several tasks and call
+                recalculate_network_from_progress once afterwards
 
         Returns:
             Task: The updated task
@@ -431,21 +754,21 @@ class CCPMScheduler:
 
         task = self.tasks[task_id]
 
+        # Progress moves the task off its baseline, so schedule() reruns
+        self._mark_stage_dirty("graph")
+
         # Store the original duration if not already tracking
-        if not hasattr(task, "original_duration"):
+        if task.original_duration is None:
             task.original_duration = task.planned_duration
 
-        # Store the previous remaining duration
-        previous_remaining = getattr(task, "remaining_duration", task.planned_duration)
-
         # Update the remaining duration
         task.remaining_duration = remaining_duration
 
         # If this is the first update, set the actual start date
-        if not hasattr(task, "actual_start_date") or not task.actual_start_date:
+        if not task.actual_start_date:
             # For first update, if status_date is after scheduled start,
             # use the scheduled start date
-            if hasattr(task, "start_date") and status_date >= task.start_date:
+            if task.start_date is not None and status_date >= task.start_date:
                 task.actual_start_date = task.start_date
             else:
                 # Use status_date if it's before the scheduled start
@@ -469,10 +792,6 @@ class CCPMScheduler:
         else:
             progress_percentage = 0
 
-        # Keep history of updates for this task
-        if not hasattr(task, "progress_history"):
-            task.progress_history = []
-
         # Add to history with completed work calculations
         task.progress_history.append(
             {
@@ -497,20 +816,70 @@ class CCPMScheduler:
             task.status = "in_progress"
 
             # Update the expected end date based on status date and remaining duration
-            task.expected_end_date = status_date + timedelta(days=remaining_duration)
+            task.expected_end_date = status_date + _days(remaining_duration)
             task.new_end_date = task.expected_end_date
 
-        # Create a set with this task ID as the only directly updated task
-        directly_updated_tasks = {task_id}
+        if recalculate:
+            # Create a set with this task ID as the only directly updated task
+            directly_updated_tasks = {task_id}
 
-        # Recalculate the network with these changes
-        self.recalculate_network_from_progress(status_date, directly_updated_tasks)
+            # Recalculate the network with these changes
+            self.recalculate_network_from_progress(status_date, directly_updated_tasks)
 
-        # Update buffer consumption based on progress
-        self._update_buffer_consumption(status_date)
+            # Update buffer consumption based on progress
+            self._update_buffer_consumption(status_date)
 
         return task
 
+    def apply_progress_updates(self, updates, status_date=None):
+        """
+        Update the progress of several tasks and recalculate the network once.
+
+        Args:
+            updates: Dict mapping task IDs to their remaining duration in days
+            status_date: The date of these updates (defaults to execution_date or today)
+
+        Returns:
+            dict: The updated tasks, keyed by task ID
+
+        Raises:
+            ValueError: If any task ID is unknown or any remaining duration is
+                not a real number; no update is applied in that case. Errors
+                raised while applying an update are re-raised after the
+                updates already applied have been recalculated.
+        """
+        # Default to execution_date or today
+        if status_date is None:
+            if hasattr(self, "execution_date") and self.execution_date:
+                status_date = self.execution_date
+            else:
+                status_date = datetime.now()
+
+        # Reject the whole batch before applying any of it
+        for task_id, remaining_duration in updates.items():
+            if task_id not in self.tasks:
+                raise ValueError(f"Task {task_id} not found in the project")
+            if not isinstance(remaining_duration, numbers.Real) or isinstance(
+                remaining_duration, bool
+            ):
+                raise ValueError(
+                    f"Remaining duration for task {task_id} must be a number"
+                )
+
+        updated = {}
+        try:
+            for task_id, remaining_duration in updates.items():
+                updated[task_id] = self.update_task_progress(
+                    task_id, remaining_duration, status_date, recalculate=False
+                )
+        finally:
+            # Even if an update fails part-way, recalculate for those applied
+            if updated:
+                self.recalculate_network_from_progress(status_date, set(updated))
+                self._update_buffer_consumption(status_date)
+
+        return updated
+
     def recalculate_network_from_progress(
         self, status_date, directly_updated_tasks=None
     ):
@@ -525,12 +894,15 @@ class CCPMScheduler:
         if directly_updated_tasks is None:
             directly_updated_tasks = set()
 
+        # The recalculated dates replace the baseline, so schedule() reruns
+        self._mark_stage_dirty("graph")
+
         # Get topological sort of tasks
         if self.task_graph:
-            task_order = list(nx.topological_sort(self.task_graph))
+            task_order = self._get_topological_order()
         else:
-            # If no task graph, just use task IDs
-            task_order = list(self.tasks.keys())
+            # If no task graph, just iterate the task IDs directly
+            task_order = self.tasks
 
         # Keep track of tasks that have received updates in this recalculation
         updated_tasks = set(directly_updated_tasks)
@@ -544,16 +916,17 @@ class CCPMScheduler:
             task = self.tasks[node]
 
             # If the task is completed or in progress, handle actual dates
-            if hasattr(task, "status") and task.status in ["completed", "in_progress"]:
+            status = task.status
+            if status in _STARTED_STATUSES:
                 # Task has started - use actual start date and remaining duration
-                if not hasattr(task, "remaining_duration"):
+                if task.remaining_duration is None:
                     task.remaining_duration = (
                         task.planned_duration
                     )  # Default if not set
 
                 # For completed tasks, ensure end date is set
-                if task.status == "completed":
-                    if not hasattr(task, "actual_end_date"):
+                if status == "completed":
+                    if task.actual_end_date is None:
                         task.actual_end_date = status_date
 
                     # Use the actual dates for new_start_date and new_end_date
@@ -569,20 +942,20 @@ class CCPMScheduler:
                     # Only update expected_end_date if this task received a direct update
                     if node in directly_updated_tasks:
                         # This task was directly updated, so recalculate expected end date
-                        task.expected_end_date = status_date + timedelta(
-                            days=task.remaining_duration
+                        task.expected_end_date = status_date + _days(
+                            task.remaining_duration
                         )
                         # Update new_end_date to match
                         task.new_end_date = task.expected_end_date
                     else:
                         # This task did not receive a direct update, so maintain its previous expected_end_date
-                        if hasattr(task, "expected_end_date"):
+                        if task.expected_end_date is not None:
                             # Use existing expected end date
                             task.new_end_date = task.expected_end_date
                         else:
                             # If no expected_end_date exists yet, initialize it
-                            task.expected_end_date = status_date + timedelta(
-                                days=task.remaining_duration
+                            task.expected_end_date = status_date + _days(
+                                task.remaining_duration
                             )
                             task.new_end_date = task.expected_end_date
 
@@ -593,7 +966,7 @@ class CCPMScheduler:
                 if not self.task_graph:
                     continue
 
-                predecessors = list(self.task_graph.predecessors(node))
+                predecessors = self._get_predecessors(node)
 
                 # If no predecessors or none of them have been updated, skip this task
                 if not predecessors or not any(
@@ -604,10 +977,7 @@ class CCPMScheduler:
                 # Calculate start based on predecessors
                 if not predecessors:
                     # Start task with no predecessors - keep original date if in future
-                    if (
-                        not hasattr(task, "new_start_date")
-                        or task.start_date > status_date
-                    ):
+                    if task.new_start_date is None or task.start_date > status_date:
                         task.new_start_date = task.start_date
                         task.remaining_duration = task.planned_duration
                     else:
@@ -617,53 +987,21 @@ class CCPMScheduler:
                 else:
                     # Find the latest end date of all predecessors
                     latest_end = status_date  # Default to today
+                    tasks = self.tasks
+                    buffers = self.buffers
 
                     for pred_id in predecessors:
-                        if pred_id in self.tasks:
-                            pred_task = self.tasks[pred_id]
-
-                            # Calculate predecessor end date based on its status
-                            if (
-                                hasattr(pred_task, "status")
-                                and pred_task.status == "completed"
-                            ):
-                                pred_end = pred_task.actual_end_date
-                            elif (
-                                hasattr(pred_task, "status")
-                                and pred_task.status == "in_progress"
-                            ):
-                                # In progress - end date is today + remaining duration
-                                pred_end = status_date + timedelta(
-                                    days=pred_task.remaining_duration
-                                )
-                            elif (
-                                hasattr(pred_task, "new_end_date")
-                                and pred_task.new_end_date is not None
-                            ):
-                                # Not started but rescheduled - use new dates
-                                pred_end = pred_task.new_end_date
-                            else:
-                                # Not started or updated - use original schedule
-                                pred_end = pred_task.end_date
-
-                            # Safely compare dates, handling None values
-                            if pred_end is not None and (
-                                latest_end is None or pred_end > latest_end
-                            ):
-                                latest_end = pred_end
-                        elif hasattr(self, "buffers") and pred_id in self.buffers:
+                        if pred_id in tasks:
+                            pred_end = self._projected_end(tasks[pred_id], status_date)
+                        elif pred_id in buffers:
                             # Predecessor is a buffer
-                            buffer = self.buffers[pred_id]
-                            if (
-                                hasattr(buffer, "new_end_date")
-                                and buffer.new_end_date is not None
-                            ):
-                                # Safely compare dates, handling None values
-                                if (
-                                    latest_end is None
-                                    or buffer.new_end_date > latest_end
-                                ):
-                                    latest_end = buffer.new_end_date
+                            pred_end = buffers[pred_id].new_end_date
+                        else:
+                            continue
+
+                        # Skip predecessors without a known end date
+                        if pred_end is not None and pred_end > latest_end:
+                            latest_end = pred_end
 
                     # Set new start date to latest predecessor end
                     task.new_start_date = latest_end
@@ -675,9 +1013,7 @@ class CCPMScheduler:
                     updated_tasks.add(node)
 
                 # Calculate new end date
-                task.new_end_date = task.new_start_date + timedelta(
-                    days=task.remaining_duration
-                )
+                task.new_end_date = task.new_start_date + _days(task.remaining_duration)
 
         # Apply resource leveling to tasks that have been updated
         if self.resources and updated_tasks:
@@ -685,16 +1021,16 @@ class CCPMScheduler:
             not_started_tasks = {
                 task_id
                 for task_id in updated_tasks
-                if not hasattr(self.tasks[task_id], "status")
-                or self.tasks[task_id].status not in ["completed", "in_progress"]
+                if self.tasks[task_id].status not in _STARTED_STATUSES
             }
 
             if not_started_tasks:
-                # Create a subset of tasks for resource leveling
+                # Create a subset of tasks for resource leveling: the updated
+                # not-started tasks and everything not started downstream of them
+                affected = self._collect_downstream_not_started(not_started_tasks)
                 tasks_subset = {
                     task_id: self.tasks[task_id]
-                    for task_id in self.tasks
-                    if task_id in not_started_tasks
+                    for task_id in sorted(affected, key=self._topo_rank.__getitem__)
                 }
 
                 # Apply resource leveling to just these tasks
@@ -704,23 +1040,92 @@ class CCPMScheduler:
                     None,  # No priority chain for this subset
                     self.task_graph,
                 )
+                # Leveling may have added resource edges to the graph
+                self._invalidate_graph_caches()
 
                 # Update the main tasks dictionary with the leveled subset
                 for task_id, task in tasks_subset.items():
                     self.tasks[task_id] = task
 
         # Update buffer positions
-        self._update_buffer_positions(status_date, updated_tasks)
+        self._update_buffer_positions(status_date)
 
         return self.tasks
 
-    def _update_buffer_positions(self, status_date, updated_tasks=None):
+    @staticmethod
+    def _current_start(task):
+        """Get a task's rescheduled start date, or its original one if unchanged."""
+        if task.new_start_date is not None:
+            return task.new_start_date
+        return task.start_date
+
+    @staticmethod
+    def _current_end(task):
+        """Get a task's rescheduled end date, or its original one if unchanged."""
+        if task.new_end_date is not None:
+            return task.new_end_date
+        return task.end_date
+
+    @staticmethod
+    def _projected_end(task, status_date):
+        """
+        Get a task's projected end date as of the status date.
+
+        Args:
+            task: The task to project
+            status_date: Current status date
+
+        Returns:
+            datetime: Actual end if completed, status date plus remaining work
+                if in progress, otherwise the rescheduled or original end date
+        """
+        status = task.status
+        if status == "completed":
+            return task.actual_end_date
+        if status == "in_progress":
+            return status_date + _days(task.remaining_duration)
+        # Not started - use the rescheduled dates if any, else the original
+        return CCPMScheduler._current_end(task)
+
+    def _collect_downstream_not_started(self, task_ids):
+        """
+        Collect the given tasks plus all not-started tasks reachable from them.
+
+        Args:
+            task_ids: IDs of not-started tasks to start the walk from
+
+        Returns:
+            set: IDs of the affected not-started tasks
+        """
+        self._refresh_graph_caches()
+
+        affected = set(task_ids)
+        queue = deque(task_ids)
+        visited = set(task_ids)
+
+        while queue:
+            node = queue.popleft()
+            for succ_id in self._succs.get(node, ()):
+                if succ_id in visited:
+                    continue
+                visited.add(succ_id)
+                queue.append(succ_id)
+
+                # Walk through buffers, but only collect tasks not yet started
+                if (
+                    succ_id in self.tasks
+                    and self.tasks[succ_id].status not in _STARTED_STATUSES
+                ):
+                    affected.add(succ_id)
+
+        return affected
+
+    def _update_buffer_positions(self, status_date):
         """
         Update buffer positions based on task progress and changes.
 
         Args:
             status_date: Current status date
-            updated_tasks: Set of task IDs that were updated
         """
         if not hasattr(self, "buffers") or not self.buffers:
             return
@@ -728,10 +1133,13 @@ class CCPMScheduler:
         if not self.task_graph:
             return
 
-        # Process each buffer
+        # Process each buffer. Every buffer is repositioned, not just those
+        # after a directly updated task: leveling and earlier delay
+        # propagation can move a buffer's predecessor or successor too, and
+        # each buffer needs its new dates set
         for buffer_id, buffer in self.buffers.items():
-            predecessors = list(self.task_graph.predecessors(buffer_id))
-            successors = list(self.task_graph.successors(buffer_id))
+            predecessors = self._get_predecessors(buffer_id)
+            successors = self._get_successors(buffer_id)
 
             if not predecessors:
                 continue
@@ -745,49 +1153,34 @@ class CCPMScheduler:
             pred_task = self.tasks[pred_id]
 
             # Determine predecessor end date
-            if hasattr(pred_task, "status") and pred_task.status == "completed":
-                pred_end = pred_task.actual_end_date
-            elif hasattr(pred_task, "status") and pred_task.status == "in_progress":
-                pred_end = status_date + timedelta(days=pred_task.remaining_duration)
-            elif (
-                hasattr(pred_task, "new_end_date")
-                and pred_task.new_end_date is not None
-            ):
-                pred_end = pred_task.new_end_date
-            else:
-                pred_end = pred_task.end_date
+            pred_end = self._projected_end(pred_task, status_date)
 
             # Update buffer position
+            buffer_end = pred_end + _days(buffer.size)
             buffer.new_start_date = pred_end
-            buffer.new_end_date = buffer.new_start_date + timedelta(days=buffer.size)
+            buffer.new_end_date = buffer_end
 
             # If this is a feeding buffer, check if it pushes critical tasks
-            if buffer.buffer_type == "feeding" and successors:
-                succ_id = successors[0]
-
-                if succ_id in self.tasks:
-                    succ_task = self.tasks[succ_id]
-
-                    # Only adjust not-started tasks
-                    if not hasattr(succ_task, "status") or succ_task.status not in [
-                        "completed",
-                        "in_progress",
-                    ]:
-                        # If buffer end pushes successor start, delay the successor
-                        # Use safe comparison to handle None values
-                        if (
-                            buffer.new_end_date is not None
-                            and succ_task.new_start_date is not None
-                            and buffer.new_end_date > succ_task.new_start_date
-                        ):
-                            succ_task.new_start_date = buffer.new_end_date
-                            succ_task.new_end_date = (
-                                succ_task.new_start_date
-                                + timedelta(days=succ_task.planned_duration)
-                            )
+            if buffer.buffer_type != "feeding" or not successors:
+                continue
+
+            succ_task = self.tasks.get(successors[0])
+            if succ_task is None:
+                continue
+
+            # If buffer end pushes the start of a not-started successor, delay
+            # the successor; the date check is cheaper than the status lookup
+            succ_start = succ_task.new_start_date
+            if (
+                succ_start is not None
+                and buffer_end > succ_start
+                and succ_task.status not in _STARTED_STATUSES
+            ):
+                succ_task.new_start_date = buffer_end
+                succ_task.new_end_date = buffer_end + _days(succ_task.planned_duration)
 
-                            # Propagate this delay downstream
-                            self._propagate_delay(succ_id, status_date)
+                # Propagate this delay downstream
+                self._propagate_delay(successors[0], status_date)
 
         return self.buffers
 
@@ -795,6 +1188,10 @@ class CCPMScheduler:
         """
         Propagate delay from the given task to all downstream tasks.
 
+        Downstream tasks are visited in topological order, so each one is
+        evaluated once, after every delayed predecessor has its final end date,
+        however many paths lead to it.
+
         Args:
             task_id: ID of the task causing the delay
             status_date: Current status date
@@ -802,39 +1199,78 @@ class CCPMScheduler:
         if task_id not in self.tasks or not self.task_graph:
             return
 
-        # Get successors
-        successors = list(self.task_graph.successors(task_id))
+        # Nothing to push downstream without a new end date
+        if self.tasks[task_id].new_end_date is None:
+            return
+
+        # Most tasks in a sparse project graph end a chain; there is
+        # nothing to propagate from them
+        self._refresh_graph_caches()
+        successors = self._succs[task_id]
+        if not successors:
+            return
+
+        tasks = self.tasks
+        rank = self._topo_rank
+
+        delayed = {task_id}
+        pending = [(rank[succ_id], succ_id) for succ_id in successors]
+        heapq.heapify(pending)
+        queued = set(successors)
+
+        while pending:
+            _, succ_id = heapq.heappop(pending)
 
-        for succ_id in successors:
             # Skip if not a task
-            if succ_id not in self.tasks:
+            if succ_id not in tasks:
+                continue
+
+            succ_task = tasks[succ_id]
+            if succ_task.new_start_date is None:
                 continue
 
-            succ_task = self.tasks[succ_id]
+            # Latest new end date among the delayed predecessors
+            task_end = max(
+                tasks[pred_id].new_end_date
+                for pred_id in self._preds[succ_id]
+                if pred_id in delayed
+            )
+
+            # Skip successors whose start already absorbs the new end date;
+            # their downstream cone cannot be affected either
+            if task_end <= succ_task.new_start_date:
+                continue
 
             # Skip tasks that already started
-            if hasattr(succ_task, "status") and succ_task.status in [
-                "completed",
-                "in_progress",
-            ]:
+            if succ_task.status in _STARTED_STATUSES:
                 continue
 
-            task = self.tasks[task_id]
+            # Delay successor
+            succ_task.new_start_date = task_end
+            succ_task.new_end_date = succ_task.new_start_date + _days(
+                succ_task.planned_duration
+            )
 
-            # Check if successor needs to be delayed - handle None values safely
-            if (
-                task.new_end_date is not None
-                and succ_task.new_start_date is not None
-                and task.new_end_date > succ_task.new_start_date
-            ):
-                # Delay successor
-                succ_task.new_start_date = task.new_end_date
-                succ_task.new_end_date = succ_task.new_start_date + timedelta(
-                    days=succ_task.planned_duration
-                )
+            # Queue its successors for evaluation
+            delayed.add(succ_id)
+            for next_id in self._succs[succ_id]:
+                if next_id not in queued:
+                    queued.add(next_id)
+                    heapq.heappush(pending, (rank[next_id], next_id))
+
+    def _feeding_chains_by_buffer(self):
+        """
+        Index the feeding chains by the ID of the buffer they feed.
 
-                # Recursively propagate to downstream tasks
-                self._propagate_delay(succ_id, status_date)
+        Built fresh on each call, since chains can be given a new buffer
+        through Chain.set_buffer without the scheduler being told.
+        """
+        index = {}
+        for chain in self.chains.values():
+            if chain.type == "feeding" and chain.buffer is not None:
+                # The first chain wins if several share a buffer
+                index.setdefault(chain.buffer.id, chain)
+        return index
 
     def _update_buffer_consumption(self, status_date):
         """
@@ -846,83 +1282,42 @@ class CCPMScheduler:
         if not hasattr(self, "buffers") or not self.buffers:
             return
 
-        # Update project buffer consumption based on critical chain progress
-        for buffer_id, buffer in self.buffers.items():
+        # Pair each buffer with the last task of the chain it protects
+        protected = []
+        chains_by_buffer = self._feeding_chains_by_buffer()
+        for buffer in self.buffers.values():
             if buffer.buffer_type == "project":
-                # Calculate project buffer consumption based on critical chain end date
-                last_task_id = self.critical_chain.tasks[-1]
-                last_task = self.tasks[last_task_id]
+                # The project buffer protects the end of the critical chain
+                last_task = self.tasks[self.critical_chain.tasks[-1]]
+                protected.append((buffer, last_task, "Critical chain delay"))
+                continue
 
-                # Get current projected end date
-                if hasattr(last_task, "status") and last_task.status == "completed":
-                    projected_end = last_task.actual_end_date
-                elif hasattr(last_task, "status") and last_task.status == "in_progress":
-                    projected_end = status_date + timedelta(
-                        days=last_task.remaining_duration
-                    )
-                elif hasattr(last_task, "new_end_date"):
-                    projected_end = last_task.new_end_date
-                else:
-                    projected_end = last_task.end_date
-
-                # Get original end date
-                original_end = last_task.end_date
-
-                # Calculate buffer consumption
-                if projected_end > original_end:
-                    delay = (projected_end - original_end).days
-                    # Consume buffer based on delay
-                    buffer_consumed = min(buffer.size, delay)
-                    buffer.remaining_size = max(0, buffer.size - buffer_consumed)
-
-                    # Record consumption
-                    buffer.consume(buffer_consumed, status_date, "Critical chain delay")
-
-            elif buffer.buffer_type == "feeding":
-                # Find the feeding chain this buffer belongs to
-                feeding_chain = None
-                for chain_id, chain in self.chains.items():
-                    if chain.type == "feeding" and chain.buffer == buffer:
-                        feeding_chain = chain
-                        break
-
-                if not feeding_chain or not feeding_chain.tasks:
-                    continue
+            if buffer.buffer_type != "feeding":
+                continue
 
-                # Get last task in the feeding chain
-                last_feeding_task_id = feeding_chain.tasks[-1]
-                last_feeding_task = self.tasks[last_feeding_task_id]
+            # Find the feeding chain this buffer belongs to
+            feeding_chain = chains_by_buffer.get(buffer.id)
 
-                # Calculate original end date
-                original_end = last_feeding_task.end_date
+            if not feeding_chain or not feeding_chain.tasks:
+                continue
 
-                # Get current projected end date
-                if (
-                    hasattr(last_feeding_task, "status")
-                    and last_feeding_task.status == "completed"
-                ):
-                    projected_end = last_feeding_task.actual_end_date
-                elif (
-                    hasattr(last_feeding_task, "status")
-                    and last_feeding_task.status == "in_progress"
-                ):
-                    projected_end = status_date + timedelta(
-                        days=last_feeding_task.remaining_duration
-                    )
-                elif hasattr(last_feeding_task, "new_end_date"):
-                    projected_end = last_feeding_task.new_end_date
-                else:
-                    projected_end = last_feeding_task.end_date
+            last_task = self.tasks[feeding_chain.tasks[-1]]
+            protected.append((buffer, last_task, "Feeding chain delay"))
 
-                # Calculate buffer consumption
-                if projected_end > original_end:
-                    delay = (projected_end - original_end).days
-                    # Consume buffer based on delay
-                    buffer_consumed = min(buffer.size, delay)
-                    buffer.remaining_size = max(0, buffer.size - buffer_consumed)
+        for buffer, last_task, reason in protected:
+            # Compare the projected end date with the original one
+            projected_end = self._projected_end(last_task, status_date)
+            original_end = last_task.end_date
 
-                    # Record consumption
-                    buffer.consume(buffer_consumed, status_date, "Feeding chain delay")
+            # Calculate buffer consumption
+            if projected_end > original_end:
+                delay = (projected_end - original_end).days
+                # Consume buffer based on delay
+                buffer_consumed = min(buffer.size, delay)
+                buffer.remaining_size = max(0, buffer.size - buffer_consumed)
+
+                # Record consumption
+                buffer.consume(buffer_consumed, status_date, reason)
 
         return self.buffers
 
@@ -970,16 +1365,40 @@ class CCPMScheduler:
         if task_id not in self.tasks:
             return []
 
-        task = self.tasks[task_id]
+        # Handle different ways resources might be stored; Task.resources is
+        # a property that builds a new list, so read it only once
+        resources = getattr(self.tasks[task_id], "resources", None)
+        if isinstance(resources, str):
+            resources = [resources]
+        elif not isinstance(resources, list):
+            resources = []
+
+        return resources
 
-        # Handle different ways resources might be stored
-        if hasattr(task, "resources"):
-            if isinstance(task.resources, list):
-                return task.resources
-            elif isinstance(task.resources, str):
-                return [task.resources]
+    def get_project_buffer(self):
+        """
+        Get the project buffer.
+
+        Returns:
+            Buffer: The project buffer, or None if none has been created
+        """
+        for buffer in self.buffers.values():
+            if buffer.buffer_type == "project":
+                return buffer
+        return None
 
-        return []
+    def get_feeding_chains(self):
+        """
+        Get the feeding chains.
+
+        Returns:
+            dict: Dictionary of feeding chains keyed by chain ID
+        """
+        return {
+            chain_id: chain
+            for chain_id, chain in self.chains.items()
+            if chain.type == "feeding"
+        }
 
     def get_full_kitted_tasks(self):
         """
@@ -1048,13 +1467,27 @@ class CCPMScheduler:
         report.append(f"Report Date: {status_date.strftime('%Y-%m-%d')}")
         report.append(f"Project Start Date: {self.start_date.strftime('%Y-%m-%d')}")
 
-        # Calculate overall project completion
-        total_duration = sum(task.planned_duration for task in self.tasks.values())
-        completed_duration = sum(
-            task.planned_duration
-            - getattr(task, "remaining_duration", task.planned_duration)
-            for task in self.tasks.values()
-        )
+        # Calculate overall project completion and group tasks by status
+        # in a single pass over the tasks
+        total_duration = 0
+        completed_duration = 0
+        in_progress = []
+        completed = []
+        not_started = []
+        for task in self.tasks.values():
+            total_duration += task.planned_duration
+            remaining = task.remaining_duration
+            if remaining is None:
+                remaining = task.planned_duration
+            completed_duration += task.planned_duration - remaining
+
+            status = task.status
+            if status == "in_progress":
+                in_progress.append(task)
+            elif status == "completed":
+                completed.append(task)
+            else:
+                not_started.append(task)
 
         if total_duration > 0:
             completion_pct = completed_duration / total_duration * 100
@@ -1072,7 +1505,7 @@ class CCPMScheduler:
                     else "Feeding Buffer"
                 )
                 original_size = buffer.size
-                remaining = getattr(buffer, "remaining_size", original_size)
+                remaining = buffer.remaining_size
                 consumed = original_size - remaining
                 consumption_pct = (
                     (consumed / original_size * 100) if original_size > 0 else 0
@@ -1095,12 +1528,6 @@ class CCPMScheduler:
                 report.append("")
 
         # Tasks in progress
-        in_progress = [
-            task
-            for task in self.tasks.values()
-            if hasattr(task, "status") and task.status == "in_progress"
-        ]
-
         if in_progress:
             report.append("\nTasks In Progress:")
             report.append("-----------------")
@@ -1111,7 +1538,7 @@ class CCPMScheduler:
                 report.append(f"  Remaining Duration: {task.remaining_duration} days")
 
                 # Calculate progress percentage
-                if hasattr(task, "original_duration") and task.original_duration > 0:
+                if task.original_duration is not None and task.original_duration > 0:
                     progress = (
                         (task.original_duration - task.remaining_duration)
                         / task.original_duration
@@ -1123,17 +1550,11 @@ class CCPMScheduler:
                     f"  Started On: {task.actual_start_date.strftime('%Y-%m-%d')}"
                 )
                 report.append(
-                    f"  Expected Completion: {(status_date + timedelta(days=task.remaining_duration)).strftime('%Y-%m-%d')}"
+                    f"  Expected Completion: {(status_date + _days(task.remaining_duration)).strftime('%Y-%m-%d')}"
                 )
                 report.append("")
 
         # Completed tasks
-        completed = [
-            task
-            for task in self.tasks.values()
-            if hasattr(task, "status") and task.status == "completed"
-        ]
-
         if completed:
             report.append("\nCompleted Tasks:")
             report.append("---------------")
@@ -1143,15 +1564,16 @@ class CCPMScheduler:
                 report.append(f"Task {task.id}: {task.name}")
                 report.append(f"  Planned Duration: {task.planned_duration} days")
 
-                if hasattr(task, "actual_start_date") and hasattr(
-                    task, "actual_end_date"
+                if (
+                    task.actual_start_date is not None
+                    and task.actual_end_date is not None
                 ):
                     actual_duration = (
                         task.actual_end_date - task.actual_start_date
                     ).days
                     report.append(f"  Actual Duration: {actual_duration} days")
 
-                if hasattr(task, "actual_start_date") and hasattr(task, "start_date"):
+                if task.actual_start_date is not None and task.start_date is not None:
                     planned_start = task.start_date
                     actual_start = task.actual_start_date
                     if actual_start > planned_start:
@@ -1163,7 +1585,7 @@ class CCPMScheduler:
                     else:
                         report.append(f"  Started on schedule")
 
-                if hasattr(task, "actual_end_date") and hasattr(task, "end_date"):
+                if task.actual_end_date is not None and task.end_date is not None:
                     planned_end = task.end_date
                     actual_end = task.actual_end_date
                     if actual_end > planned_end:
@@ -1177,43 +1599,31 @@ class CCPMScheduler:
 
                 report.append("")
 
-        # Upcoming tasks (not started yet)
-        not_started = [
-            task
-            for task in self.tasks.values()
-            if not hasattr(task, "status")
-            or task.status not in ["completed", "in_progress"]
-        ]
-
-        # Sort by start date
-        not_started.sort(key=lambda x: getattr(x, "new_start_date", x.start_date))
+        # Upcoming tasks (not started yet): only the next 5 to start are shown,
+        # so select them instead of sorting every not-started task
+        upcoming = heapq.nsmallest(5, not_started, key=self._current_start)
 
-        if not_started:
+        if upcoming:
             report.append("\nUpcoming Tasks:")
             report.append("--------------")
 
             # Show the next 5 tasks to start
-            for task in not_started[: min(5, len(not_started))]:
+            for task in upcoming:
                 # Get the appropriate start date (new or original)
-                start_date = getattr(task, "new_start_date", task.start_date)
+                start_date = self._current_start(task)
 
                 report.append(f"Task {task.id}: {task.name}")
                 report.append(f"  Planned Duration: {task.planned_duration} days")
                 report.append(f"  Scheduled Start: {start_date.strftime('%Y-%m-%d')}")
 
                 # Get resource info
-                resources = []
-                if hasattr(task, "resources"):
-                    if isinstance(task.resources, list):
-                        resources = task.resources
-                    elif isinstance(task.resources, str):
-                        resources = [task.resources]
+                resources = self.get_task_resources(task.id)
 
                 if resources:
                     report.append(f"  Resources: {', '.join(resources)}")
 
                 # Show chain information if available
-                if hasattr(task, "chain_id") and task.chain_id:
+                if task.chain_id:
                     chain_type = (
                         "Critical Chain"
                         if task.chain_type == "critical"
@@ -1225,24 +1635,17 @@ class CCPMScheduler:
 
         # Find projected end date including project buffer
         latest_task_end = max(
-            (
-                getattr(task, "new_end_date", task.end_date)
-                for task in self.tasks.values()
-            ),
+            (self._current_end(task) for task in self.tasks.values()),
             default=status_date,
         )
 
-        project_buffer = None
-        for buffer in self.buffers.values():
-            if buffer.buffer_type == "project":
-                project_buffer = buffer
-                break
+        project_buffer = self.get_project_buffer()
 
         if project_buffer:
-            if hasattr(project_buffer, "new_end_date") and project_buffer.new_end_date:
+            if project_buffer.new_end_date:
                 projected_end = project_buffer.new_end_date
             else:
-                projected_end = latest_task_end + timedelta(days=project_buffer.size)
+                projected_end = latest_task_end + _days(project_buffer.size)
 
             # Add this null check before using projected_end
             if projected_end:
@@ -1251,7 +1654,7 @@ class CCPMScheduler:
                 )
 
                 # Calculate if project is ahead or behind schedule
-                if hasattr(project_buffer, "end_date") and project_buffer.end_date:
+                if project_buffer.end_date:
                     original_end = project_buffer.end_date
 
                     # Add null check for both variables
@@ -1305,10 +1708,16 @@ class CCPMScheduler:
         if progress_percentages is None:
             progress_percentages = {}
 
+        # Update every task first, then recalculate the network once
+        updated_task_ids = set()
+
         # Mark tasks as completed
         for task_id in completed_task_ids:
             if task_id in self.tasks:
-                self.update_task_progress(task_id, 0, simulation_date)
+                self.update_task_progress(
+                    task_id, 0, simulation_date, recalculate=False
+                )
+                updated_task_ids.add(task_id)
 
         # Mark tasks as in progress with specified progress
         for task_id in in_progress_task_ids:
@@ -1324,6 +1733,13 @@ class CCPMScheduler:
                 remaining = max(0.1, remaining)  # Ensure some work remains
 
                 # Update progress
-                self.update_task_progress(task_id, remaining, simulation_date)
+                self.update_task_progress(
+                    task_id, remaining, simulation_date, recalculate=False
+                )
+                updated_task_ids.add(task_id)
+
+        if updated_task_ids:
+            self.recalculate_network_from_progress(simulation_date, updated_task_ids)
+            self._update_buffer_consumption(simulation_date)
 
         return self.tasks, self.buffers
@@ -0,0 +1,4 @@
+from datetime import datetime
+
+# Fixed reference time so date arithmetic in the tests is deterministic
+FIXED_NOW = datetime(2024, 1, 1)
@@ -181,23 +181,24 @@ def create_sample_network():
     )
 
     # Add all tasks to scheduler
-    for task in [
-        task1,
-        task2,
-        task3,
-        task4,
-        task5,
-        task6,
-        task7,
-        task8,
-        task9,
-        task10,
-        task11,
-        task12,
-        task13,
-        task14,
-    ]:
-        scheduler.add_task(task)
+    scheduler.add_tasks(
+        [
+            task1,
+            task2,
+            task3,
+            task4,
+            task5,
+            task6,
+            task7,
+            task8,
+            task9,
+            task10,
+            task11,
+            task12,
+            task13,
+            task14,
+        ]
+    )
 
     # Schedule the project
     scheduler.schedule()
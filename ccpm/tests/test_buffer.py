@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from datetime import datetime, timedelta
 from ccpm.domain.buffer import Buffer, BufferError
@@ -219,6 +220,29 @@ class BufferTestCase(unittest.TestCase):
         with self.assertRaises(BufferError):
             self.project_buffer.add_note(123)  # Not a string
 
+    def test_notes_order(self):
+        """Test that notes keep insertion order, including direct edits."""
+        day = datetime(2025, 4, 15)
+        self.project_buffer.add_note("Later", day + timedelta(days=1))
+        self.project_buffer.add_note("First tie", day)
+        self.project_buffer.notes.append({"date": day, "text": "Second tie"})
+
+        self.assertEqual(
+            [note["text"] for note in self.project_buffer.get_notes()],
+            ["Later", "First tie", "Second tie"],
+        )
+        self.assertEqual(
+            [note["text"] for note in self.project_buffer.get_notes(day, day)],
+            ["First tie", "Second tie"],
+        )
+
+        # Replacing the list is picked up as well
+        self.project_buffer.notes = [{"date": day, "text": "Assigned"}]
+        self.assertEqual(
+            [note["text"] for note in self.project_buffer.get_notes(start_date=day)],
+            ["Assigned"],
+        )
+
     def test_flow_data(self):
         """Test cumulative flow data generation."""
         # Set dates and consume buffer over time
@@ -316,6 +340,17 @@ class BufferTestCase(unittest.TestCase):
         self.assertEqual(new_buffer.remaining_size, self.project_buffer.remaining_size)
         self.assertEqual(new_buffer.status, self.project_buffer.status)
 
+    def test_pickle_round_trip(self):
+        """Test that pickling keeps the full buffer state."""
+        now = datetime.now()
+        self.feeding_buffer.consume(2, now, "Delay")
+        self.feeding_buffer.add_note("Checked", now)
+
+        restored = pickle.loads(pickle.dumps(self.feeding_buffer))
+
+        self.assertEqual(restored.to_dict(), self.feeding_buffer.to_dict())
+        self.assertEqual(restored.get_notes(), self.feeding_buffer.get_notes())
+
     def test_buffer_cfd_with_none_dates(self):
         """Test generating cumulative flow data with None dates and empty history."""
         # Create a buffer with no consumption history
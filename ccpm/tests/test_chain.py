@@ -3,6 +3,12 @@ from datetime import datetime, timedelta
 from ccpm.domain.chain import Chain, ChainError
 from ccpm.domain.task import Task
 from ccpm.domain.buffer import Buffer
+from ccpm.tests import FIXED_NOW
+
+
+def _jan(day, hour=0):
+    """Return the given day and hour of January 2024."""
+    return datetime(2024, 1, day, hour)
 
 
 class ChainTestCase(unittest.TestCase):
@@ -29,26 +35,19 @@ class ChainTestCase(unittest.TestCase):
 
     def test_initialization_validation(self):
         """Test validation during chain initialization."""
-        # Invalid ID
-        with self.assertRaises(ChainError):
-            Chain(id=None, name="Invalid Chain")
-
-        # Invalid name
-        with self.assertRaises(ChainError):
-            Chain(id="c1", name="")
-
-        # Invalid type
-        with self.assertRaises(ChainError):
-            Chain(id="c1", name="Invalid Type", type="invalid")
-
-        # Invalid buffer ratio
-        with self.assertRaises(ChainError):
-            Chain(id="c1", name="Invalid Ratio", buffer_ratio=-0.1)
-
-        with self.assertRaises(ChainError):
-            Chain(id="c1", name="Invalid Ratio", buffer_ratio=1.5)
+        invalid_cases = {
+            "id": {"id": None, "name": "Invalid Chain"},
+            "name": {"id": "c1", "name": ""},
+            "type": {"id": "c1", "name": "Invalid Type", "type": "invalid"},
+            "ratio-low": {"id": "c1", "name": "Invalid Ratio", "buffer_ratio": -0.1},
+            "ratio-high": {"id": "c1", "name": "Invalid Ratio", "buffer_ratio": 1.5},
+        }
+        for case, kwargs in invalid_cases.items():
+            with self.subTest(case=case), self.assertRaises(ChainError):
+                Chain(**kwargs)
 
-        # Valid chain
+    def test_valid_initialization(self):
+        """Test that a valid chain keeps its attributes."""
         chain = Chain(id="c1", name="Valid Chain", type="critical", buffer_ratio=0.5)
         self.assertEqual(chain.id, "c1")
         self.assertEqual(chain.name, "Valid Chain")
@@ -83,6 +82,19 @@ class ChainTestCase(unittest.TestCase):
         with self.assertRaises(ChainError):
             self.chain.add_task(None)
 
+    def test_extend_tasks(self):
+        """Test adding tasks in bulk."""
+        self.chain.add_task("task2")
+        self.chain.extend_tasks(["task1", "task2", "task3", "task1"])
+
+        # Duplicates are ignored and order is kept
+        self.assertEqual(self.chain.tasks, ["task2", "task1", "task3"])
+
+        # An invalid ID rejects the whole batch
+        with self.assertRaises(ChainError):
+            self.chain.extend_tasks(["task4", None])
+        self.assertNotIn("task4", self.chain.tasks)
+
     def test_connection_management(self):
         """Test setting connection points."""
         # Set connection
@@ -103,12 +115,10 @@ class ChainTestCase(unittest.TestCase):
     def test_status_tracking(self):
         """Test status tracking and calculation."""
         # Add tasks to chain
-        self.chain.add_task("task1")
-        self.chain.add_task("task2")
-        self.chain.add_task("task3")
+        self.chain.extend_tasks(["task1", "task2", "task3"])
 
         # Start tasks in the tasks dictionary
-        now = datetime.now()
+        now = FIXED_NOW
         self.tasks["task1"].start_task(now)
         self.tasks["task1"].update_progress(
             0, now + timedelta(days=5)
@@ -126,9 +136,11 @@ class ChainTestCase(unittest.TestCase):
         # task3: 0/7 = 0%
         # Overall: (5 + 5 + 0) / (5 + 10 + 7) = 10/22 ≈ 45.45%
 
-        self.assertAlmostEqual(result["completion_percentage"], 45.45, delta=0.1)
         self.assertEqual(result["total_duration"], 22)
-        self.assertAlmostEqual(result["completed_duration"], 10, delta=0.1)
+        approximate = {"completion_percentage": 45.45, "completed_duration": 10}
+        for key, value in approximate.items():
+            with self.subTest(key=key):
+                self.assertAlmostEqual(result[key], value, delta=0.1)
 
         # Check status history
         self.assertEqual(len(self.chain.status_history), 1)
@@ -150,7 +162,7 @@ class ChainTestCase(unittest.TestCase):
         self.assertEqual(self.chain.buffer, buffer)
 
         # Consume some buffer
-        now = datetime.now()
+        now = FIXED_NOW
         buffer.consume(2, now, "Test consumption")
 
         # Check buffer consumption
@@ -181,7 +193,7 @@ class ChainTestCase(unittest.TestCase):
         self.chain.set_buffer(buffer)
 
         # Add some status history
-        self.chain.update_status(self.tasks, datetime.now())
+        self.chain.update_status(self.tasks, FIXED_NOW)
 
         # Convert to dictionary
         chain_dict = self.chain.to_dict()
@@ -216,7 +228,7 @@ class ChainTestCase(unittest.TestCase):
         self.chain.add_task("task2")
 
         # Start tasks
-        now = datetime.now()
+        now = FIXED_NOW
         self.tasks["task1"].start_task(now - timedelta(days=5))
         self.tasks["task1"].update_progress(
             0, now - timedelta(days=2)
@@ -246,6 +258,64 @@ class ChainTestCase(unittest.TestCase):
         # Check completion percentage tracking
         self.assertEqual(len(flow_data["completion_percentage"]), 11)
 
+    def test_flow_data_values(self):
+        """Test the per-day counts and completion in the cumulative flow data."""
+        self.chain.extend_tasks(["task1", "task2", "task3"])
+
+        # task1 started and finished, but its history wins where visible;
+        # entries are applied in list order, not date order
+        task1 = self.tasks["task1"]
+        task1.actual_start_date = _jan(2, 12)  # Counted from 3 Jan
+        task1.actual_end_date = _jan(4)
+        task1.status = "completed"
+        task1.progress_history = [
+            {"date": _jan(5), "status": "in_progress"},
+            {"date": _jan(3), "status": "planned"},
+            {"date": _jan(4), "remaining": 1},  # No status, ignored
+        ]
+
+        # task2 is on hold from its start onwards
+        self.tasks["task2"].actual_start_date = _jan(2)
+        self.tasks["task2"].status = "on_hold"
+
+        # task3 finishes part-way through a day, counted from the next day
+        self.tasks["task3"].actual_start_date = _jan(2)
+        self.tasks["task3"].actual_end_date = _jan(4, 6)
+        self.tasks["task3"].status = "completed"
+
+        # Completion comes from the last visible chain status entry
+        self.chain.status_history = [
+            {"date": datetime(2023, 12, 30), "completion_percentage": 10.0},
+            {"date": _jan(5), "completion_percentage": 60.0},
+            {"date": _jan(3, 6), "completion_percentage": 40.0},
+        ]
+
+        flow_data = self.chain.get_cumulative_flow_data(_jan(1), _jan(6), self.tasks)
+        self.assertEqual(
+            flow_data["dates"],
+            [f"2024-01-0{d}" for d in range(1, 7)],
+        )
+        self.assertEqual(
+            flow_data["status_counts"],
+            {
+                "planned": [3, 1, 1, 1, 1, 1],
+                "in_progress": [0, 1, 1, 1, 0, 0],
+                "completed": [0, 0, 0, 0, 1, 1],
+                "on_hold": [0, 1, 1, 1, 1, 1],
+                "cancelled": [0, 0, 0, 0, 0, 0],
+            },
+        )
+        self.assertEqual(
+            flow_data["completion_percentage"],
+            [10.0, 10.0, 10.0, 40.0, 40.0, 40.0],
+        )
+
+        # An end date before the start date gives an empty diagram
+        empty = self.chain.get_cumulative_flow_data(_jan(6), _jan(1), self.tasks)
+        self.assertEqual(empty["dates"], [])
+        self.assertEqual(empty["completion_percentage"], [])
+        self.assertTrue(all(counts == [] for counts in empty["status_counts"].values()))
+
     def test_chain_cfd_with_none_dates(self):
         """Test generating chain cumulative flow data with None values and edge cases."""
         # Create a chain and tasks with minimal initialization
@@ -261,7 +331,7 @@ class ChainTestCase(unittest.TestCase):
         }
 
         # Task 1 has dates
-        tasks["task1"].set_schedule(datetime.now() - timedelta(days=5))
+        tasks["task1"].set_schedule(FIXED_NOW - timedelta(days=5))
 
         # Test with no dates specified
         cfd = chain.get_cumulative_flow_data(None, None, tasks)
@@ -271,7 +341,7 @@ class ChainTestCase(unittest.TestCase):
         self.assertIn("status_counts", cfd)
 
         # Start one task but don't complete
-        tasks["task1"].start_task(datetime.now() - timedelta(days=3))
+        tasks["task1"].start_task(FIXED_NOW - timedelta(days=3))
         cfd = chain.get_cumulative_flow_data(None, None, tasks)
 
         # Should show one task as in_progress
@@ -1,10 +1,10 @@
 import unittest
-from datetime import datetime, timedelta
+from datetime import timedelta
 from ccpm.domain.task import Task
 from ccpm.domain.chain import Chain
 from ccpm.domain.buffer import Buffer
 from ccpm.services.buffer_strategies import SumOfSquaresMethod
-
+from ccpm.tests import FIXED_NOW
 
 import sys
 import os
@@ -17,7 +17,7 @@ class DomainIntegrationTestCase(unittest.TestCase):
 
     def setUp(self):
         """Set up a simple project structure with tasks, chains, and buffers."""
-        self.today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.today = FIXED_NOW
 
         # Create tasks
         self.tasks = {
@@ -57,8 +57,8 @@ class DomainIntegrationTestCase(unittest.TestCase):
         )
 
         # Assign tasks to chains
-        self.critical_chain.add_task("t1").add_task("t2").add_task("t3")
-        self.feeding_chain.add_task("t4").add_task("t5")
+        self.critical_chain.extend_tasks(["t1", "t2", "t3"])
+        self.feeding_chain.extend_tasks(["t4", "t5"])
 
         # Set feeding chain connection
         self.feeding_chain.set_connection("t2")
@@ -159,25 +159,6 @@ class DomainIntegrationTestCase(unittest.TestCase):
         self.critical_chain.update_status(self.tasks)
         self.feeding_chain.update_status(self.tasks)
 
-        # Debug After updating task progress but before assertions
-        for task_id in self.critical_chain.tasks:
-            task = self.tasks[task_id]
-            print(
-                f"Task {task_id}: status={task.status}, planned_duration={task.planned_duration}, "
-                f"progress={task.get_progress_percentage() if hasattr(task, 'get_progress_percentage') else 'N/A'}"
-            )
-
-        # After updating chain status
-        print(
-            f"Critical chain: completion={self.critical_chain.completion_percentage}%"
-        )
-        print(
-            f"Total duration: {self.critical_chain.status_history[-1]['total_duration']}"
-        )
-        print(
-            f"Completed duration: {self.critical_chain.status_history[-1]['completed_duration']}"
-        )
-
         # Check critical chain completion
         # t1 complete (10 days), t2 half done (10 days), t3 not started (0 days)
         # 10 + 10 + 0 = 20 completed out of 45 days = ~44.4%
@@ -10,12 +10,15 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
+import logging
 import unittest
 from datetime import datetime, timedelta
 from ccpm.domain.task import Task
 from ccpm.services.scheduler import CCPMScheduler
 from ccpm.services.buffer_strategies import CutAndPasteMethod, SumOfSquaresMethod
 
+logger = logging.getLogger(__name__)
+
 
 class CCPMExecutionTest(unittest.TestCase):
     def setUp(self):
@@ -89,6 +92,11 @@ class CCPMExecutionTest(unittest.TestCase):
         # Run scheduler to create initial schedule
         self.scheduler.schedule()
 
+        # Status date at the end of each week; index 0 is the project start
+        self.week_dates = tuple(
+            self.start_date + timedelta(days=7 * week) for week in range(9)
+        )
+
     def test_execute_project(self):
         """Test project execution with weekly updates."""
         # Check initial state
@@ -104,16 +112,12 @@ class CCPMExecutionTest(unittest.TestCase):
         self.assertIn("T3", critical_tasks)
 
         # Verify that T4, T5 form a feeding chain
-        feeding_chains = [
-            chain
-            for chain_id, chain in self.scheduler.chains.items()
-            if chain.type == "feeding"
-        ]
+        feeding_chains = self.scheduler.get_feeding_chains()
         self.assertGreater(len(feeding_chains), 0)
 
         # Find the feeding chain containing T4 and T5
         feeding_chain = None
-        for chain in feeding_chains:
+        for chain in feeding_chains.values():
             if "T4" in chain.tasks and "T5" in chain.tasks:
                 feeding_chain = chain
                 break
@@ -121,16 +125,12 @@ class CCPMExecutionTest(unittest.TestCase):
         self.assertIsNotNone(feeding_chain)
 
         # Week 1: Start T1 and T4
-        week1_date = self.start_date + timedelta(days=7)
-        print(f"\n=== Week 1 ({week1_date.strftime('%Y-%m-%d')}) ===")
+        week1_date = self.week_dates[1]
+        logger.debug("=== Week 1 (%s) ===", week1_date.date())
 
-        # Update task progress: T1 is 30% complete, T4 is 40% complete
-        self.scheduler.update_task_progress(
-            "T1", 7, week1_date
-        )  # 30% complete (3/10 days)
-        self.scheduler.update_task_progress(
-            "T4", 3, week1_date
-        )  # 40% complete (2/5 days)
+        # Update task progress: T1 is 30% complete (3/10 days),
+        # T4 is 40% complete (2/5 days)
+        self.scheduler.apply_progress_updates({"T1": 7, "T4": 3}, week1_date)
 
         # Verify task status
         self.assertEqual(self.scheduler.tasks["T1"].status, "in_progress")
@@ -141,14 +141,11 @@ class CCPMExecutionTest(unittest.TestCase):
         self.assertEqual(self.scheduler.tasks["T4"].remaining_duration, 3)
 
         # Week 2: Complete T4, continue T1
-        week2_date = self.start_date + timedelta(days=14)
-        print(f"\n=== Week 2 ({week2_date.strftime('%Y-%m-%d')}) ===")
+        week2_date = self.week_dates[2]
+        logger.debug("=== Week 2 (%s) ===", week2_date.date())
 
-        # Update task progress: T1 is 60% complete, T4 is complete
-        self.scheduler.update_task_progress(
-            "T1", 4, week2_date
-        )  # 60% complete (6/10 days)
-        self.scheduler.update_task_progress("T4", 0, week2_date)  # 100% complete
+        # Update task progress: T1 is 60% complete (6/10 days), T4 is complete
+        self.scheduler.apply_progress_updates({"T1": 4, "T4": 0}, week2_date)
 
         # Verify task status
         self.assertEqual(self.scheduler.tasks["T1"].status, "in_progress")
@@ -163,14 +160,11 @@ class CCPMExecutionTest(unittest.TestCase):
         self.assertIsNotNone(feeding_buffer.new_start_date)
 
         # Week 3: Complete T1, start T5
-        week3_date = self.start_date + timedelta(days=21)
-        print(f"\n=== Week 3 ({week3_date.strftime('%Y-%m-%d')}) ===")
+        week3_date = self.week_dates[3]
+        logger.debug("=== Week 3 (%s) ===", week3_date.date())
 
-        # Update task progress: T1 is complete, T5 is 20% complete (started)
-        self.scheduler.update_task_progress("T1", 0, week3_date)  # 100% complete
-        self.scheduler.update_task_progress(
-            "T5", 12, week3_date
-        )  # 20% complete (3/15 days)
+        # Update task progress: T1 is complete, T5 is 20% complete (3/15 days)
+        self.scheduler.apply_progress_updates({"T1": 0, "T5": 12}, week3_date)
 
         # Verify task status
         self.assertEqual(self.scheduler.tasks["T1"].status, "completed")
@@ -184,38 +178,31 @@ class CCPMExecutionTest(unittest.TestCase):
         self.assertEqual(self.scheduler.tasks["T2"].status, "in_progress")
 
         # Week 4: Continue T2 and T5
-        week4_date = self.start_date + timedelta(days=28)
-        print(f"\n=== Week 4 ({week4_date.strftime('%Y-%m-%d')}) ===")
+        week4_date = self.week_dates[4]
+        logger.debug("=== Week 4 (%s) ===", week4_date.date())
 
-        # Update task progress: T2 is 25% complete, T5 is 50% complete
-        self.scheduler.update_task_progress(
-            "T2", 15, week4_date
-        )  # 25% complete (5/20 days)
-        self.scheduler.update_task_progress(
-            "T5", 7.5, week4_date
-        )  # 50% complete (7.5/15 days)
+        # Update task progress: T2 is 25% complete (5/20 days),
+        # T5 is 50% complete (7.5/15 days)
+        self.scheduler.apply_progress_updates({"T2": 15, "T5": 7.5}, week4_date)
 
         # Verify task status
         self.assertEqual(self.scheduler.tasks["T2"].status, "in_progress")
         self.assertEqual(self.scheduler.tasks["T5"].status, "in_progress")
 
         # Week 5: Continue T2, Complete T5
-        week5_date = self.start_date + timedelta(days=35)
-        print(f"\n=== Week 5 ({week5_date.strftime('%Y-%m-%d')}) ===")
+        week5_date = self.week_dates[5]
+        logger.debug("=== Week 5 (%s) ===", week5_date.date())
 
-        # Update task progress: T2 is 50% complete, T5 is complete
-        self.scheduler.update_task_progress(
-            "T2", 10, week5_date
-        )  # 50% complete (10/20 days)
-        self.scheduler.update_task_progress("T5", 0, week5_date)  # 100% complete
+        # Update task progress: T2 is 50% complete (10/20 days), T5 is complete
+        self.scheduler.apply_progress_updates({"T2": 10, "T5": 0}, week5_date)
 
         # Verify task status
         self.assertEqual(self.scheduler.tasks["T2"].status, "in_progress")
         self.assertEqual(self.scheduler.tasks["T5"].status, "completed")
 
         # Week 6: Complete T2
-        week6_date = self.start_date + timedelta(days=42)
-        print(f"\n=== Week 6 ({week6_date.strftime('%Y-%m-%d')}) ===")
+        week6_date = self.week_dates[6]
+        logger.debug("=== Week 6 (%s) ===", week6_date.date())
 
         # Update task progress: T2 is complete
         self.scheduler.update_task_progress("T2", 0, week6_date)  # 100% complete
@@ -231,8 +218,8 @@ class CCPMExecutionTest(unittest.TestCase):
         self.assertEqual(self.scheduler.tasks["T3"].status, "in_progress")
 
         # Week 7: Continue T3
-        week7_date = self.start_date + timedelta(days=49)
-        print(f"\n=== Week 7 ({week7_date.strftime('%Y-%m-%d')}) ===")
+        week7_date = self.week_dates[7]
+        logger.debug("=== Week 7 (%s) ===", week7_date.date())
 
         # Update task progress: T3 is 50% complete
         self.scheduler.update_task_progress(
@@ -243,8 +230,8 @@ class CCPMExecutionTest(unittest.TestCase):
         self.assertEqual(self.scheduler.tasks["T3"].status, "in_progress")
 
         # Week 8: Complete T3
-        week8_date = self.start_date + timedelta(days=56)
-        print(f"\n=== Week 8 ({week8_date.strftime('%Y-%m-%d')}) ===")
+        week8_date = self.week_dates[8]
+        logger.debug("=== Week 8 (%s) ===", week8_date.date())
 
         # Update task progress: T3 is complete
         self.scheduler.update_task_progress("T3", 0, week8_date)  # 100% complete
@@ -254,38 +241,33 @@ class CCPMExecutionTest(unittest.TestCase):
 
         # Check that all tasks are now complete
         completed_count = sum(
-            1
-            for task in self.scheduler.tasks.values()
-            if hasattr(task, "status") and task.status == "completed"
+            task.status == "completed" for task in self.scheduler.tasks.values()
         )
         self.assertEqual(completed_count, 5)
 
         # Check buffer consumption
-        project_buffer = None
-        for buffer in self.scheduler.buffers.values():
-            if buffer.buffer_type == "project":
-                project_buffer = buffer
-                break
-
+        project_buffer = self.scheduler.get_project_buffer()
         self.assertIsNotNone(project_buffer)
 
-        # Print buffer consumption
-        print(
-            f"\nProject buffer consumption: {project_buffer.get_consumption_percentage():.1f}%"
+        logger.debug(
+            "Project buffer consumption: %.1f%%",
+            project_buffer.get_consumption_percentage(),
         )
-        print(
-            f"Project buffer remaining: {project_buffer.remaining_size} / {project_buffer.size} days"
+        logger.debug(
+            "Project buffer remaining: %s / %s days",
+            project_buffer.remaining_size,
+            project_buffer.size,
         )
 
         # Generate execution report
         report = self.scheduler.generate_execution_report(week8_date)
-        print("\n=== Final Execution Report ===")
-        print(report)
+        self.assertTrue(report)
+        logger.debug("=== Final Execution Report ===\n%s", report)
 
     def test_simulation_function(self):
         """Test the project simulation function."""
         # Simulate week 1
-        week1_date = self.start_date + timedelta(days=7)
+        week1_date = self.week_dates[1]
         self.scheduler.simulate_execution(
             week1_date,
             in_progress_task_ids=["T1", "T4"],
@@ -297,7 +279,7 @@ class CCPMExecutionTest(unittest.TestCase):
         self.assertEqual(self.scheduler.tasks["T4"].status, "in_progress")
 
         # Simulate week 2 - complete T4
-        week2_date = self.start_date + timedelta(days=14)
+        week2_date = self.week_dates[2]
         self.scheduler.simulate_execution(
             week2_date,
             completed_task_ids=["T4"],
@@ -310,7 +292,7 @@ class CCPMExecutionTest(unittest.TestCase):
         self.assertEqual(self.scheduler.tasks["T4"].status, "completed")
 
         # Simulate week 3 - complete T1, start T2 and T5
-        week3_date = self.start_date + timedelta(days=21)
+        week3_date = self.week_dates[3]
         self.scheduler.simulate_execution(
             week3_date,
             completed_task_ids=["T1"],
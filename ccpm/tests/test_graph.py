@@ -0,0 +1,76 @@
+import unittest
+
+import networkx as nx
+
+from ccpm.domain.task import Task
+from ccpm.utils.graph import (
+    DAG,
+    build_dependency_graph,
+    forward_pass,
+    backward_pass,
+    topological_order,
+)
+
+
+def _adjacency(graph):
+    """Return the successor and predecessor lists of a networkx graph."""
+    succ = {node: list(graph.successors(node)) for node in graph.nodes()}
+    pred = {node: list(graph.predecessors(node)) for node in graph.nodes()}
+    return succ, pred
+
+
+class DAGTestCase(unittest.TestCase):
+    """Test cases for the lightweight DAG adjacency view."""
+
+    def setUp(self):
+        self.tasks = {
+            "A": Task("A", "Task A", aggressive_duration=3),
+            "B": Task("B", "Task B", aggressive_duration=5, dependencies=["A"]),
+            "C": Task("C", "Task C", aggressive_duration=2, dependencies=["A"]),
+            "D": Task("D", "Task D", aggressive_duration=4, dependencies=["B", "C"]),
+        }
+
+    def test_topological_sort(self):
+        """Test Kahn's ordering and cycle detection."""
+        dag = DAG(*_adjacency(build_dependency_graph(self.tasks)))
+        order = dag.topological_sort()
+
+        self.assertEqual(sorted(order), ["A", "B", "C", "D"])
+        for u in dag.succ:
+            for v in dag.successors(u):
+                self.assertLess(order.index(u), order.index(v))
+
+        cyclic = DAG({"A": ["B"], "B": ["A"]}, {"A": ["B"], "B": ["A"]})
+        with self.assertRaises(ValueError):
+            cyclic.topological_sort()
+
+    def test_topological_order_matches_networkx(self):
+        """Test that Kahn's order over adjacency dicts matches networkx."""
+        graph = build_dependency_graph(self.tasks)
+        graph.add_edge("C", "B")
+
+        self.assertEqual(
+            topological_order(*_adjacency(graph)), list(nx.topological_sort(graph))
+        )
+
+    def test_passes_accept_dag(self):
+        """Test forward/backward passes give the same results on both graph types."""
+        graph = build_dependency_graph(self.tasks)
+        self.assertIsInstance(graph, nx.DiGraph)
+
+        dag = DAG(*_adjacency(graph))
+        forward_pass(dag, self.tasks)
+        backward_pass(dag, self.tasks)
+        from_dag = {t.id: (t.early_start, t.late_start) for t in self.tasks.values()}
+
+        forward_pass(graph, self.tasks)
+        backward_pass(graph, self.tasks)
+        from_nx = {t.id: (t.early_start, t.late_start) for t in self.tasks.values()}
+
+        self.assertEqual(from_dag, from_nx)
+        self.assertEqual(self.tasks["D"].early_start, 8)
+        self.assertEqual(self.tasks["C"].slack, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
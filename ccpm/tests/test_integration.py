@@ -1,5 +1,7 @@
 import unittest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from ccpm.domain.buffer import Buffer
 from ccpm.domain.task import Task
 from ccpm.services.scheduler import CCPMScheduler
 
@@ -92,6 +94,342 @@ class CCPMIntegrationTest(unittest.TestCase):
         self.assertEqual(task1.status, "completed")
         self.assertEqual(task1.remaining_duration, 0)
 
+    def test_progress_moves_successors(self):
+        """Test that progress updates reschedule successors and the project buffer"""
+        self.scheduler.schedule()
+
+        # Task 1 is two days late, so everything after it moves by two days
+        self.scheduler.update_task_progress(1, 8, datetime(2025, 4, 5))
+        self.assertEqual(self.scheduler.tasks[2].new_start_date, datetime(2025, 4, 13))
+        self.assertEqual(self.scheduler.tasks[3].new_start_date, datetime(2025, 5, 3))
+        self.assertEqual(
+            self.scheduler.buffers["PB"].new_start_date, datetime(2025, 5, 18)
+        )
+
+        # A second update moves them again
+        self.scheduler.update_task_progress(1, 3, datetime(2025, 4, 12))
+        self.assertEqual(self.scheduler.tasks[2].new_start_date, datetime(2025, 4, 15))
+        self.assertEqual(self.scheduler.tasks[3].new_end_date, datetime(2025, 5, 20))
+        self.assertEqual(
+            self.scheduler.buffers["PB"].new_start_date, datetime(2025, 5, 20)
+        )
+
+        # A task added and scheduled later is moved by the next update too
+        self.scheduler.add_task(
+            Task(4, "Task 4", aggressive_duration=5, dependencies=[3])
+        )
+        self.scheduler.schedule()
+        self.scheduler.update_task_progress(1, 8, datetime(2025, 4, 5))
+        self.assertEqual(self.scheduler.tasks[4].new_start_date, datetime(2025, 5, 18))
+        self.assertEqual(
+            self.scheduler.buffers["PB"].new_start_date, datetime(2025, 5, 23)
+        )
+
+    def test_timezone_aware_start_date(self):
+        """Test that baseline dates keep the timezone of the start date"""
+        tz = timezone(timedelta(hours=2))
+        self.scheduler.set_start_date(datetime(2025, 4, 1, 9, tzinfo=tz))
+        self.scheduler.schedule()
+
+        task2 = self.scheduler.tasks[2]
+        self.assertEqual(task2.start_date, datetime(2025, 4, 11, 9, tzinfo=tz))
+        self.assertEqual(task2.start_date.utcoffset(), timedelta(hours=2))
+        self.assertEqual(task2.end_date, datetime(2025, 5, 1, 9, tzinfo=tz))
+
+    def test_incremental_schedule(self):
+        """Test that an incremental schedule() reruns only after tracked edits"""
+        self.scheduler.schedule()
+        graph = self.scheduler.task_graph
+        start_dates = {
+            task_id: task.start_date for task_id, task in self.scheduler.tasks.items()
+        }
+
+        # Nothing changed, so no stage reruns
+        self.scheduler.schedule(incremental=True)
+        self.assertIs(self.scheduler.task_graph, graph)
+        for task_id, task in self.scheduler.tasks.items():
+            self.assertEqual(task.start_date, start_dates[task_id])
+
+        # Assigning the resources reruns the pipeline from the graph stage
+        self.scheduler.resources = ["Resource A", "Resource B"]
+        self.scheduler.schedule(incremental=True)
+        self.assertIsNot(self.scheduler.task_graph, graph)
+
+        # So does assigning the start date
+        graph = self.scheduler.task_graph
+        self.scheduler.start_date = datetime(2025, 4, 2)
+        self.scheduler.schedule(incremental=True)
+        self.assertIsNot(self.scheduler.task_graph, graph)
+
+        # And a progress update
+        graph = self.scheduler.task_graph
+        self.scheduler.update_task_progress(1, 5, datetime(2025, 4, 5))
+        self.scheduler.schedule(incremental=True)
+        self.assertIsNot(self.scheduler.task_graph, graph)
+
+        # A plain schedule() always reruns every stage
+        graph = self.scheduler.task_graph
+        self.scheduler.schedule()
+        self.assertIsNot(self.scheduler.task_graph, graph)
+
+    def test_reschedule_after_task_edit(self):
+        """Test that schedule() picks up a direct task edit"""
+        self.scheduler.schedule()
+        self.assertEqual(self.scheduler.buffers["PB"].size, 22)
+
+        task1 = self.scheduler.tasks[1]
+        task1.aggressive_duration = task1.safe_duration = 20
+        task1.planned_duration = 20
+        self.scheduler.schedule()
+        self.assertEqual(self.scheduler.buffers["PB"].size, 28)
+
+    def test_buffers_applied_after_new_start_date(self):
+        """Test that apply_buffer_to_schedule dates tasks again after a re-baseline"""
+        self.scheduler.schedule()
+
+        task3 = self.scheduler.tasks[3]
+        task3.start_date = task3.end_date = None
+        self.scheduler.set_start_date(datetime(2025, 5, 1))
+        self.scheduler.apply_buffer_to_schedule()
+
+        self.assertEqual(task3.start_date, datetime(2025, 5, 31))
+        self.assertEqual(task3.end_date, datetime(2025, 6, 15))
+
+    def test_reschedule_after_settings_edit(self):
+        """Test that the buffer setting setters mark the schedule for a rerun"""
+        self.scheduler.schedule()
+        self.assertEqual(self.scheduler.buffers["PB"].size, 22)
+
+        self.scheduler.project_buffer_ratio = 1.0
+        self.scheduler.schedule(incremental=True)
+        self.assertEqual(self.scheduler.buffers["PB"].size, 45)
+
+    def test_buffer_partitions_follow_replaced_buffers(self):
+        """Test that swapping a buffer object re-partitions the buffers"""
+        self.scheduler.schedule()
+        self.assertIs(self.scheduler.get_project_buffer(), self.scheduler.buffers["PB"])
+
+        # Same key, same count: only the object changes
+        replacement = Buffer("PB", "Replacement Buffer", 10, buffer_type="project")
+        self.scheduler.buffers["PB"] = replacement
+        self.assertIs(self.scheduler.get_project_buffer(), replacement)
+
+    def test_feeding_buffer_consumption_follows_chain_buffer(self):
+        """Test that a feeding chain given a new buffer consumes that buffer"""
+        scheduler = CCPMScheduler().set_start_date(datetime(2025, 4, 1))
+        scheduler.add_tasks(
+            [
+                Task("A", "A", aggressive_duration=10, safe_duration=15),
+                Task("B", "B", aggressive_duration=4, safe_duration=8),
+                Task("C", "C", aggressive_duration=5, dependencies=["A", "B"]),
+            ]
+        )
+        scheduler.schedule()
+        chain = scheduler.chains["feeding_1"]
+
+        replacement = Buffer(
+            "FB_feeding_1", "Replacement", 4, buffer_type="feeding", connected_to="C"
+        )
+        scheduler.buffers[replacement.id] = replacement
+        scheduler.update_task_progress("B", 4, datetime(2025, 4, 1))
+
+        # Re-point the chain after the buffers were last looked up
+        chain.set_buffer(replacement)
+        scheduler.update_task_progress("B", 3, datetime(2025, 4, 5))
+        self.assertEqual(replacement.remaining_size, 0)
+
+    def test_critical_task_waits_for_feeding_buffer(self):
+        """Test that an unrelated update keeps a task behind its feeding buffer"""
+        scheduler = CCPMScheduler().set_start_date(datetime(2025, 4, 1))
+        scheduler.add_tasks(
+            [
+                Task("A", "A", aggressive_duration=10, safe_duration=15),
+                Task("B", "B", aggressive_duration=6, safe_duration=10),
+                Task("C", "C", aggressive_duration=5, dependencies=["A", "B"]),
+            ]
+        )
+        scheduler.schedule()
+
+        # Only the critical predecessor finishes early; the feeding chain
+        # and its buffer are untouched by the update
+        scheduler.update_task_progress("A", 0, datetime(2025, 4, 4))
+        feeding_buffer = scheduler.buffers["FB_feeding_1"]
+        self.assertEqual(feeding_buffer.new_end_date, datetime(2025, 4, 11))
+        self.assertGreaterEqual(
+            scheduler.tasks["C"].new_start_date, feeding_buffer.new_end_date
+        )
+        self.assertIsNotNone(scheduler.buffers["PB"].new_end_date)
+
+    def test_feeding_buffers_fit_after_cascading_delays(self):
+        """Test that a feeding chain behind a delayed critical task still fits"""
+        scheduler = CCPMScheduler().set_start_date(datetime(2025, 4, 1))
+        scheduler.add_tasks(
+            [
+                Task("A", "A", aggressive_duration=10),
+                Task("Y", "Y", aggressive_duration=8, safe_duration=16),
+                Task("B", "B", aggressive_duration=1, dependencies=["A", "Y"]),
+                Task("C", "C", aggressive_duration=2, dependencies=["B"]),
+                Task(
+                    "X", "X", aggressive_duration=1, safe_duration=4, dependencies=["B"]
+                ),
+                Task("D", "D", aggressive_duration=5, dependencies=["C", "X"]),
+            ]
+        )
+        scheduler.schedule()
+
+        # FB_feeding_1 delays B, which moves X and its buffer towards D
+        tasks = scheduler.tasks
+        self.assertEqual(tasks["B"].start_date, datetime(2025, 4, 17))
+        for buffer in scheduler.buffers.values():
+            if buffer.buffer_type == "feeding":
+                merge_task = tasks[buffer.connected_to]
+                self.assertLessEqual(buffer.end_date, merge_task.start_date)
+        self.assertEqual(tasks["D"].start_date, datetime(2025, 4, 22))
+
+    def test_buffer_and_chain_lookups(self):
+        """Test the project buffer and feeding chain accessors"""
+        self.assertIsNone(self.scheduler.get_project_buffer())
+
+        self.scheduler.schedule()
+        project_buffer = self.scheduler.get_project_buffer()
+        self.assertEqual(project_buffer.buffer_type, "project")
+        self.assertIs(project_buffer, self.scheduler.buffers[project_buffer.id])
+
+        # A project buffer swapped in under a new key replaces the old one
+        del self.scheduler.buffers["PB"]
+        replacement = Buffer("PB2", "Project Buffer 2", 10, buffer_type="project")
+        self.scheduler.buffers["PB2"] = replacement
+        self.assertIs(self.scheduler.get_project_buffer(), replacement)
+
+        feeding_chains = self.scheduler.get_feeding_chains()
+        self.assertTrue(
+            all(chain.type == "feeding" for chain in feeding_chains.values())
+        )
+        self.assertNotIn(self.scheduler.critical_chain.id, feeding_chains)
+
+    def test_task_resources_follow_allocations(self):
+        """Test that get_task_resources reflects allocation edits"""
+        self.assertEqual(self.scheduler.get_task_resources(1), ["Resource A"])
+
+        self.scheduler.tasks[1].resource_allocations["Resource C"] = 1.0
+        resources = self.scheduler.get_task_resources(1)
+        self.assertEqual(resources, ["Resource A", "Resource C"])
+
+        # Mutating the returned list does not leak into later lookups
+        resources.append("Resource X")
+        self.assertEqual(
+            self.scheduler.get_task_resources(1), ["Resource A", "Resource C"]
+        )
+        self.assertEqual(self.scheduler.get_task_resources(99), [])
+
+    def test_full_kitted_tasks(self):
+        """Test that full kitted tasks are tracked through the scheduler"""
+        self.assertEqual(self.scheduler.get_full_kitted_tasks(), {})
+
+        self.scheduler.set_task_full_kitted(1, True, datetime(2025, 3, 30))
+        self.assertEqual(list(self.scheduler.get_full_kitted_tasks()), [1])
+
+        self.scheduler.set_task_full_kitted(1, False, datetime(2025, 3, 31))
+        self.assertEqual(self.scheduler.get_full_kitted_tasks(), {})
+
+        # Tasks kitted on the Task itself are found too, in task order
+        self.scheduler.tasks[3].set_full_kitted(True, datetime(2025, 4, 1))
+        self.scheduler.set_task_full_kitted(2, True, datetime(2025, 4, 2))
+        self.assertEqual(list(self.scheduler.get_full_kitted_tasks()), [2, 3])
+
+    def test_add_tasks(self):
+        """Test that adding tasks in bulk matches adding them one at a time"""
+        tasks = [
+            Task(
+                i, f"Task {i}", aggressive_duration=5, dependencies=[i - 1] if i else []
+            )
+            for i in range(4)
+        ]
+        bulk = CCPMScheduler().set_start_date(datetime(2025, 4, 1))
+        self.assertIs(bulk.add_tasks(tasks), bulk)
+        self.assertEqual(list(bulk.tasks), [0, 1, 2, 3])
+
+        bulk.schedule()
+        self.assertEqual(bulk.critical_chain.tasks, [0, 1, 2, 3])
+
+        # Adding after scheduling invalidates the schedule
+        bulk.add_tasks([Task(4, "Task 4", aggressive_duration=5, dependencies=[3])])
+        bulk.schedule()
+        self.assertEqual(bulk.critical_chain.tasks, [0, 1, 2, 3, 4])
+
+    def test_apply_progress_updates(self):
+        """Test that a batch of progress updates is applied with one recalculation"""
+        self.scheduler.schedule()
+        status_date = datetime(2025, 4, 15)
+
+        updated = self.scheduler.apply_progress_updates({1: 0, 2: 18}, status_date)
+        self.assertEqual(set(updated), {1, 2})
+        self.assertEqual(self.scheduler.tasks[1].status, "completed")
+        self.assertEqual(self.scheduler.tasks[2].status, "in_progress")
+        self.assertEqual(
+            self.scheduler.tasks[2].new_end_date, status_date + timedelta(days=18)
+        )
+
+        # The successor is pushed behind its updated predecessor
+        self.assertGreaterEqual(
+            self.scheduler.tasks[3].new_start_date,
+            self.scheduler.tasks[2].new_end_date,
+        )
+
+        # An unknown task rejects the whole batch
+        with self.assertRaises(ValueError):
+            self.scheduler.apply_progress_updates({3: 5, 99: 1}, status_date)
+        self.assertEqual(self.scheduler.tasks[3].status, "planned")
+
+        # So does an invalid remaining duration anywhere in the batch
+        with self.assertRaises(ValueError):
+            self.scheduler.apply_progress_updates({3: 5, 2: "soon"}, status_date)
+        self.assertEqual(self.scheduler.tasks[3].status, "planned")
+        self.assertEqual(self.scheduler.tasks[2].remaining_duration, 18)
+
+        # A bool is not a remaining duration, even though it is an int
+        with self.assertRaises(ValueError):
+            self.scheduler.apply_progress_updates({3: 5, 2: True}, status_date)
+        self.assertEqual(self.scheduler.tasks[3].status, "planned")
+
+        # Any real number is accepted, as by update_task_progress
+        self.scheduler.apply_progress_updates({2: np.float64(12)}, status_date)
+        self.assertEqual(self.scheduler.tasks[2].remaining_duration, 12)
+
+    def test_progress_through_long_chain(self):
+        """Test that delays propagate through chains deeper than the recursion limit"""
+        scheduler = CCPMScheduler()
+        scheduler.set_start_date(datetime(2025, 4, 1))
+        length = sys.getrecursionlimit() + 100
+        scheduler.add_tasks(
+            Task(
+                i, f"Task {i}", aggressive_duration=1, dependencies=[i - 1] if i else []
+            )
+            for i in range(length)
+        )
+        scheduler.schedule()
+
+        # Delay the first task by two days
+        scheduler.update_task_progress(0, 3, datetime(2025, 4, 1))
+
+        last_task = scheduler.tasks[length - 1]
+        self.assertEqual(
+            last_task.new_start_date,
+            datetime(2025, 4, 1) + timedelta(days=length + 1),
+        )
+
+    def test_progress_rejects_cycles(self):
+        """Test that a cycle added after scheduling raises instead of hanging"""
+        self.scheduler.schedule()
+
+        # A cycle introduced by a later graph edit, e.g. a resource edge
+        graph = self.scheduler.task_graph.copy()
+        graph.add_edge(3, 1)
+        self.scheduler.task_graph = graph
+
+        with self.assertRaises(ValueError):
+            self.scheduler.update_task_progress(1, 12, datetime(2025, 4, 5))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -387,6 +387,47 @@ class TaskTestCase(unittest.TestCase):
         past_notes = self.task.get_notes(end_date=today)
         self.assertEqual(len(past_notes), 2)
 
+    def test_notes_order(self):
+        """Test that notes keep insertion order and date filters are inclusive."""
+        day = datetime(2025, 4, 15)
+        self.task.add_note("Later", day + timedelta(days=2))
+        self.task.add_note("First tie", day)
+        self.task.add_note("Second tie", day)
+        self.task.add_note("Earlier", day - timedelta(days=1))
+
+        self.assertEqual(
+            [note["text"] for note in self.task.get_notes()],
+            ["Later", "First tie", "Second tie", "Earlier"],
+        )
+        self.assertEqual(
+            [note["text"] for note in self.task.get_notes(day, day)],
+            ["First tie", "Second tie"],
+        )
+        self.assertEqual(
+            [note["text"] for note in self.task.get_notes(start_date=day)],
+            ["Later", "First tie", "Second tie"],
+        )
+        self.assertEqual(
+            self.task.get_notes(day + timedelta(hours=1), day + timedelta(days=1)),
+            [],
+        )
+
+    def test_notes_edited_directly(self):
+        """Test that notes added to the notes list directly are returned."""
+        day = datetime(2025, 4, 15)
+        self.task.add_note("Added", day)
+        self.task.notes.append({"date": day - timedelta(days=1), "text": "Appended"})
+        self.assertEqual(
+            [note["text"] for note in self.task.get_notes()], ["Added", "Appended"]
+        )
+
+        self.task.notes = [{"date": day, "text": "Assigned"}]
+        self.task.add_note("Added again", day - timedelta(days=1))
+        self.assertEqual(
+            [note["text"] for note in self.task.get_notes(end_date=day)],
+            ["Assigned", "Added again"],
+        )
+
     def test_serialization(self):
         """Test serialization to and from dictionary."""
         # Start a task and do some progress
@@ -433,6 +474,24 @@ class TaskTestCase(unittest.TestCase):
         # Original should be unchanged
         self.assertEqual(self.task.name, "Test Task")
 
+    def test_copy_keeps_full_state(self):
+        """Test that copy keeps progress, notes and allocations independently."""
+        start_date = datetime(2025, 4, 15)
+        self.task.start_task(start_date)
+        self.task.update_progress(5, start_date + timedelta(days=5))
+        self.task.add_note("Halfway", start_date + timedelta(days=5))
+
+        task_copy = self.task.copy()
+        self.assertEqual(task_copy.resource_allocations, self.task.resource_allocations)
+        self.assertEqual(task_copy.progress_history, self.task.progress_history)
+        self.assertEqual(task_copy.get_notes(), self.task.get_notes())
+
+        # Containers are not shared with the original
+        task_copy.add_note("Copy only", start_date + timedelta(days=6))
+        task_copy.add_tag("copied")
+        self.assertEqual(len(self.task.get_notes()), 1)
+        self.assertNotIn("copied", self.task.tags)
+
     def test_delayed_task_detection(self):
         """Test detection of delayed tasks."""
         # Planned task is not delayed
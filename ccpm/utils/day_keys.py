@@ -0,0 +1,51 @@
+from datetime import date, timedelta
+
+
+def day_labels(start_date, end_date):
+    """
+    Label every day from start_date to end_date, inclusive.
+
+    The labels are built from ordinal day numbers rather than by stepping a
+    datetime forward one day at a time. A range whose end is before its start
+    has no days.
+
+    Args:
+        start_date: First day of the range (date or datetime)
+        end_date: Last day of the range (date or datetime)
+
+    Returns:
+        list: "YYYY-MM-DD" strings, one per day
+    """
+    if end_date < start_date:
+        return []
+
+    day_count = (end_date - start_date) // timedelta(days=1) + 1
+    start_ord = start_date.toordinal()
+    return [day_key(date.fromordinal(start_ord + i)) for i in range(day_count)]
+
+
+def first_day_on_or_after(start_date, when):
+    """
+    Index of the first day in a day_labels() range that is not before when.
+
+    Args:
+        start_date: First day of the range
+        when: Date or datetime to place in the range
+
+    Returns:
+        int: Day index, or 0 if when is before start_date
+    """
+    return max(0, -((start_date - when) // timedelta(days=1)))
+
+
+def day_key(value):
+    """
+    Key for the day of a date or datetime, as used in per-day series.
+
+    Args:
+        value: Date or datetime
+
+    Returns:
+        str: The day as "YYYY-MM-DD"
+    """
+    return value.isoformat()[:10]
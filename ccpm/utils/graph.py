@@ -1,6 +1,92 @@
+from collections import deque
+
 import networkx as nx
 
 
+class DAG:
+    """
+    Read-only directed graph view over plain adjacency lists.
+
+    Provides the successors() and topological_sort() calls that forward_pass
+    and backward_pass make, without networkx's nested-dict overhead. The
+    scheduler wraps the adjacency lists it caches from its networkx task
+    graph; the services and visualizations keep using the networkx graph.
+    """
+
+    def __init__(self, succ, pred):
+        """
+        Wrap successor/predecessor dicts without copying them.
+
+        The dicts are shared, so they must not be mutated afterwards.
+
+        Args:
+            succ: Dictionary mapping each node to a list of its successors
+            pred: Dictionary mapping each node to a list of its predecessors
+        """
+        self.succ = succ
+        self.pred = pred
+        self._order = None  # Cached topological order
+
+    def successors(self, node):
+        """Iterate over the successors of a node"""
+        return iter(self.succ[node])
+
+    def topological_sort(self):
+        """
+        Return the nodes in topological order using Kahn's algorithm.
+
+        The order is computed on the first call and reused afterwards.
+
+        Raises:
+            ValueError: If the graph contains a cycle
+        """
+        if self._order is None:
+            self._order = topological_order(self.succ, self.pred)
+        return list(self._order)
+
+
+def topological_order(succ, pred):
+    """
+    Order the nodes of a graph given as adjacency dicts using Kahn's algorithm.
+
+    Ready nodes are processed first-in first-out, which yields the same order
+    as networkx.topological_sort for a graph with the same node and edge order.
+
+    Args:
+        succ: Dictionary mapping each node to a list of its successors
+        pred: Dictionary mapping each node to a list of its predecessors
+
+    Returns:
+        list: The nodes in topological order
+
+    Raises:
+        ValueError: If the graph contains a cycle
+    """
+    in_degree = {node: len(preds) for node, preds in pred.items()}
+    ready = deque(node for node, degree in in_degree.items() if degree == 0)
+    order = []
+
+    while ready:
+        node = ready.popleft()
+        order.append(node)
+        for succ_id in succ[node]:
+            in_degree[succ_id] -= 1
+            if in_degree[succ_id] == 0:
+                ready.append(succ_id)
+
+    if len(order) != len(succ):
+        raise ValueError("Task dependencies contain cycles!")
+
+    return order
+
+
+def _topological_sort(graph):
+    """Return the nodes of a DAG or networkx graph in topological order"""
+    if isinstance(graph, DAG):
+        return graph.topological_sort()
+    return list(nx.topological_sort(graph))
+
+
 def build_dependency_graph(tasks):
     """Build a directed graph representing task dependencies"""
     G = nx.DiGraph()
@@ -25,7 +111,7 @@ def build_dependency_graph(tasks):
 def forward_pass(graph, tasks):
     """Calculate early start and early finish times"""
     # Topological sort to get tasks in order
-    task_order = list(nx.topological_sort(graph))
+    task_order = _topological_sort(graph)
 
     # Initialize start task
     for task_id in task_order:
@@ -59,7 +145,8 @@ def forward_pass(graph, tasks):
 def backward_pass(graph, tasks):
     """Calculate late start and late finish times"""
     # Reverse topological sort
-    task_order = list(reversed(list(nx.topological_sort(graph))))
+    task_order = _topological_sort(graph)
+    task_order.reverse()
 
     # Find project duration
     project_duration = max(
@@ -72,10 +159,10 @@ def backward_pass(graph, tasks):
             continue
 
         task = tasks[task_id]
-        successors = list(graph.successors(task_id))
-
         # Filter out successors that aren't tasks
-        successors = [succ_id for succ_id in successors if succ_id in tasks]
+        successors = [
+            succ_id for succ_id in graph.successors(task_id) if succ_id in tasks
+        ]
 
         if not successors:  # End task
             task.late_finish = project_duration